@@ -28,10 +28,10 @@ def upgrade() -> None:
         sa.Column('captured_at', sa.DateTime(), nullable=False),
         sa.Column('file_path', sa.String(500), nullable=False),
         sa.Column('created_at', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_snapshots_id', 'id'),
+        sa.Index('ix_snapshots_symbol', 'symbol'),
     )
-    op.create_index('ix_snapshots_id', 'snapshots', ['id'])
-    op.create_index('ix_snapshots_symbol', 'snapshots', ['symbol'])
 
     # Economic events table
     op.create_table(
@@ -47,11 +47,11 @@ def upgrade() -> None:
         sa.Column('source', sa.String(50), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_economic_events_id', 'id'),
+        sa.Index('ix_economic_events_event_time_utc', 'event_time_utc'),
+        sa.Index('ix_economic_events_currency', 'currency'),
     )
-    op.create_index('ix_economic_events_id', 'economic_events', ['id'])
-    op.create_index('ix_economic_events_event_time_utc', 'economic_events', ['event_time_utc'])
-    op.create_index('ix_economic_events_currency', 'economic_events', ['currency'])
 
     # News items table
     op.create_table(
@@ -66,10 +66,10 @@ def upgrade() -> None:
         sa.Column('confidence', sa.Float(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('url')
+        sa.UniqueConstraint('url'),
+        sa.Index('ix_news_items_id', 'id'),
+        sa.Index('ix_news_items_published_at', 'published_at'),
     )
-    op.create_index('ix_news_items_id', 'news_items', ['id'])
-    op.create_index('ix_news_items_published_at', 'news_items', ['published_at'])
 
     # TA signals table
     op.create_table(
@@ -84,11 +84,11 @@ def upgrade() -> None:
         sa.Column('ict_notes', sa.Text(), nullable=True),
         sa.Column('turtle_soup_json', sa.JSON(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_ta_signals_id', 'id'),
+        sa.Index('ix_ta_signals_date', 'date'),
+        sa.Index('ix_ta_signals_symbol', 'symbol'),
     )
-    op.create_index('ix_ta_signals_id', 'ta_signals', ['id'])
-    op.create_index('ix_ta_signals_date', 'ta_signals', ['date'])
-    op.create_index('ix_ta_signals_symbol', 'ta_signals', ['symbol'])
 
     # Daily reports table
     op.create_table(
@@ -100,11 +100,11 @@ def upgrade() -> None:
         sa.Column('primary_snapshot_id', sa.Integer(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['primary_snapshot_id'], ['snapshots.id']),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_daily_reports_id', 'id'),
+        sa.Index('ix_daily_reports_date', 'date'),
+        sa.Index('ix_daily_reports_symbol', 'symbol'),
     )
-    op.create_index('ix_daily_reports_id', 'daily_reports', ['id'])
-    op.create_index('ix_daily_reports_date', 'daily_reports', ['date'])
-    op.create_index('ix_daily_reports_symbol', 'daily_reports', ['symbol'])
 
 
 def downgrade() -> None:
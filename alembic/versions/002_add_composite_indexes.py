@@ -0,0 +1,40 @@
+"""add_composite_indexes
+
+Revision ID: 002
+Revises: 787c76271bd9
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '787c76271bd9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Calendar lookups filter on a time range plus currency/impact; time first
+    # so range scans use the leftmost prefix. Supersedes the single-column index.
+    op.create_index(
+        'ix_economic_events_time_ccy_impact',
+        'economic_events',
+        ['event_time_utc', 'currency', 'impact'],
+    )
+    op.drop_index('ix_economic_events_event_time_utc', table_name='economic_events')
+
+    # Signals and reports are always looked up by symbol + date
+    op.create_index('ix_ta_signals_symbol_date', 'ta_signals', ['symbol', 'date'])
+    op.create_index('ix_daily_reports_symbol_date', 'daily_reports', ['symbol', 'date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_daily_reports_symbol_date', table_name='daily_reports')
+    op.drop_index('ix_ta_signals_symbol_date', table_name='ta_signals')
+
+    op.create_index('ix_economic_events_event_time_utc', 'economic_events', ['event_time_utc'])
+    op.drop_index('ix_economic_events_time_ccy_impact', table_name='economic_events')
@@ -0,0 +1,36 @@
+"""add_event_identity_index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate events left by earlier scrapes, keeping the oldest row
+    op.execute(
+        "DELETE FROM economic_events WHERE id NOT IN ("
+        "SELECT MIN(id) FROM economic_events "
+        "GROUP BY event_time_utc, currency, title)"
+    )
+    op.create_index(
+        'ix_event_identity',
+        'economic_events',
+        ['event_time_utc', 'currency', 'title'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_event_identity', table_name='economic_events')
@@ -0,0 +1,39 @@
+"""add_news_category
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('news_items', sa.Column('category', sa.String(20), nullable=True))
+
+    # Backfill from the source label, which is always "Federal Reserve (<category>)"
+    op.execute(
+        "UPDATE news_items SET category = substr(source, 18, length(source) - 18) "
+        "WHERE source LIKE 'Federal Reserve (%)'"
+    )
+
+    # FOMC news is looked up by category over a date range; top drivers are
+    # read in confidence order within the recent window
+    op.create_index('ix_news_items_category_published', 'news_items', ['category', 'published_at'])
+    op.create_index('ix_news_items_confidence_published', 'news_items', ['confidence', 'published_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_news_items_confidence_published', table_name='news_items')
+    op.drop_index('ix_news_items_category_published', table_name='news_items')
+    op.drop_column('news_items', 'category')
@@ -0,0 +1,49 @@
+"""add_signal_report_identity
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop superseded rows, keeping the newest signal/report per symbol/date
+    op.execute(
+        "DELETE FROM ta_signals WHERE timeframe IS NULL AND id NOT IN ("
+        "SELECT MAX(id) FROM ta_signals WHERE timeframe IS NULL "
+        "GROUP BY symbol, date)"
+    )
+    op.execute(
+        "DELETE FROM daily_reports WHERE id NOT IN ("
+        "SELECT MAX(id) FROM daily_reports GROUP BY symbol, date)"
+    )
+
+    # One aggregate signal and one report per symbol/date, used as the
+    # upsert conflict targets
+    op.create_index(
+        'ix_ta_signals_aggregate',
+        'ta_signals',
+        ['symbol', 'date'],
+        unique=True,
+        sqlite_where=sa.text('timeframe IS NULL'),
+    )
+    op.drop_index('ix_daily_reports_symbol_date', table_name='daily_reports')
+    op.create_index('ix_daily_reports_symbol_date', 'daily_reports', ['symbol', 'date'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_daily_reports_symbol_date', table_name='daily_reports')
+    op.create_index('ix_daily_reports_symbol_date', 'daily_reports', ['symbol', 'date'])
+    op.drop_index('ix_ta_signals_aggregate', table_name='ta_signals')
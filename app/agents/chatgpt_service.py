@@ -9,18 +9,36 @@ Requires: playwright, playwright install chromium
 
 import asyncio
 import json
-import os
-from datetime import datetime
+import re
 from pathlib import Path
 from typing import List, Optional, Tuple
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # ChatGPT URLs
 CHATGPT_URL = "https://chat.openai.com/"
 CHATGPT_NEW_CHAT_URL = "https://chat.openai.com/?model=gpt-4o"
 
+# Either the chat input (logged in) or the login button marks the UI as ready
+CHAT_INPUT_SELECTOR = 'textarea[id="prompt-textarea"], div[id="prompt-textarea"]'
+PAGE_READY_SELECTOR = f'{CHAT_INPUT_SELECTOR}, button[data-testid="login-button"]'
+SEND_BUTTON_SELECTOR = 'button[data-testid="send-button"], button[aria-label="Send prompt"]'
+
+# Default for navigation and locator actions; the response wait sets its own
+DEFAULT_TIMEOUT_MS = 30000
+SEND_BUTTON_TIMEOUT_MS = 5000
+
+# Seconds between "still generating" messages while waiting for a response
+PROGRESS_INTERVAL = 30
+
+# Fenced code block, optionally tagged as json
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+
+_DECODER = json.JSONDecoder()
+
 # Cookies file for session persistence
 COOKIES_FILE = Path(__file__).parent.parent.parent / "data" / ".chatgpt_cookies.json"
 
@@ -28,8 +46,7 @@ COOKIES_FILE = Path(__file__).parent.parent.parent / "data" / ".chatgpt_cookies.
 def save_cookies(cookies: List[dict]):
     """Save browser cookies to file for session persistence."""
     COOKIES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(COOKIES_FILE, "w") as f:
-        json.dump(cookies, f, indent=2)
+    COOKIES_FILE.write_bytes(orjson.dumps(cookies))
     logger.info(f"Saved {len(cookies)} cookies to {COOKIES_FILE}")
 
 
@@ -37,8 +54,7 @@ def load_cookies() -> Optional[List[dict]]:
     """Load browser cookies from file."""
     if COOKIES_FILE.exists():
         try:
-            with open(COOKIES_FILE, "r") as f:
-                cookies = json.load(f)
+            cookies = orjson.loads(COOKIES_FILE.read_bytes())
             logger.info(f"Loaded {len(cookies)} cookies from {COOKIES_FILE}")
             return cookies
         except Exception as e:
@@ -46,6 +62,19 @@ def load_cookies() -> Optional[List[dict]]:
     return None
 
 
+async def wait_for_page_ready(page, timeout: int = 30):
+    """
+    Wait until ChatGPT's UI is interactive (chat input or login button shown),
+    rather than for all background network activity to settle.
+    """
+    try:
+        await page.wait_for_selector(PAGE_READY_SELECTOR, timeout=timeout * 1000)
+        return True
+    except Exception as e:
+        logger.warning(f"Page not ready after {timeout}s: {e}")
+        return False
+
+
 async def wait_for_login(page, timeout: int = 120):
     """
     Wait for user to complete manual login.
@@ -59,10 +88,7 @@ async def wait_for_login(page, timeout: int = 120):
     
     try:
         # Wait for the chat input to appear (indicates successful login)
-        await page.wait_for_selector(
-            'textarea[id="prompt-textarea"], div[id="prompt-textarea"]',
-            timeout=timeout * 1000
-        )
+        await page.wait_for_selector(CHAT_INPUT_SELECTOR, timeout=timeout * 1000)
         logger.info("Login successful - chat input detected")
         return True
     except Exception as e:
@@ -117,25 +143,17 @@ async def submit_prompt(page, prompt_text: str) -> bool:
     logger.info("Submitting prompt...")
     
     try:
-        # Find the textarea
-        textarea = await page.query_selector('textarea[id="prompt-textarea"], div[id="prompt-textarea"]')
-        
-        if not textarea:
-            logger.error("Could not find prompt textarea")
-            return False
+        # Locators auto-wait for the element to be visible and enabled
+        textarea = page.locator(CHAT_INPUT_SELECTOR).first
         
         # Clear any existing text and type the prompt
         await textarea.click()
         await textarea.fill(prompt_text)
         
-        await asyncio.sleep(0.5)
-        
-        # Find and click the send button
-        send_button = await page.query_selector('button[data-testid="send-button"], button[aria-label="Send prompt"]')
-        
-        if send_button:
-            await send_button.click()
-        else:
+        # Click the send button once it becomes enabled
+        try:
+            await page.locator(SEND_BUTTON_SELECTOR).first.click(timeout=SEND_BUTTON_TIMEOUT_MS)
+        except Exception:
             # Try pressing Enter as fallback
             await textarea.press("Enter")
         
@@ -147,6 +165,21 @@ async def submit_prompt(page, prompt_text: str) -> bool:
         return False
 
 
+# Resolves in the browser once generation has stopped and the latest
+# assistant message length has been unchanged for 5 consecutive polls
+# (handles thinking pauses; only a length is kept between polls)
+_RESPONSE_DONE_JS = """() => {
+    const msgs = document.querySelectorAll('div[data-message-author-role="assistant"]');
+    const generating = document.querySelector('button[aria-label="Stop generating"]');
+    if (!msgs.length) return false;
+    const len = msgs[msgs.length - 1].innerText.length;
+    const stable = len > 50 && len === window.__advisorLastLength;
+    window.__advisorLastLength = len;
+    window.__advisorStableCount = stable ? (window.__advisorStableCount || 0) + 1 : 0;
+    return window.__advisorStableCount >= 5 && !generating;
+}"""
+
+
 async def wait_for_response(page, timeout: int = 0) -> Optional[str]:
     """
     Wait for ChatGPT to finish generating a response.
@@ -161,48 +194,41 @@ async def wait_for_response(page, timeout: int = 0) -> Optional[str]:
     else:
         logger.info("Waiting for response (no timeout - ChatGPT thinking mode)...")
     
-    start_time = asyncio.get_event_loop().time()
-    last_response = ""
-    stable_count = 0
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     
+    # Completion is detected in the page itself; wait in bounded slices so
+    # progress can be reported every PROGRESS_INTERVAL seconds
+    start_time = asyncio.get_running_loop().time()
     while True:
-        # Check timeout if set
-        if timeout > 0 and asyncio.get_event_loop().time() - start_time > timeout:
-            logger.warning("Response timeout - returning partial response")
-            return last_response if last_response else None
-        
+        elapsed = int(asyncio.get_running_loop().time() - start_time)
+        slice_s = PROGRESS_INTERVAL if timeout <= 0 else max(1, min(PROGRESS_INTERVAL, timeout - elapsed))
         try:
-            # Check if still generating (stop button visible)
-            stop_button = await page.query_selector('button[aria-label="Stop generating"]')
-            
-            # Get the latest assistant response
-            responses = await page.query_selector_all('div[data-message-author-role="assistant"]')
-            
-            if responses:
-                latest_response = await responses[-1].inner_text()
-                
-                # Check if response is stable (not changing)
-                if latest_response == last_response and len(latest_response) > 50:
-                    stable_count += 1
-                    # Need more stable checks (5 instead of 3) to handle thinking pauses
-                    if stable_count >= 5 and not stop_button:
-                        logger.info("Response complete")
-                        return latest_response
-                else:
-                    stable_count = 0
-                    last_response = latest_response
-                    
-                    # Show progress every 30 seconds
-                    elapsed = int(asyncio.get_event_loop().time() - start_time)
-                    if elapsed > 0 and elapsed % 30 == 0:
-                        preview = latest_response[:100].replace('\n', ' ')
-                        logger.info(f"Still generating ({elapsed}s)... {preview}...")
-            
-            await asyncio.sleep(2)
-            
+            await page.wait_for_function(_RESPONSE_DONE_JS, polling=2000, timeout=slice_s * 1000)
+            logger.info("Response complete")
+            break
+        except PlaywrightTimeoutError:
+            elapsed = int(asyncio.get_running_loop().time() - start_time)
+            if 0 < timeout <= elapsed:
+                logger.warning("Response timeout - returning partial response")
+                break
+            try:
+                length = await page.evaluate("() => window.__advisorLastLength || 0")
+            except Exception:
+                length = 0
+            logger.info(f"Still generating ({elapsed}s)... {length} chars")
         except Exception as e:
-            logger.warning(f"Error checking response: {e}")
-            await asyncio.sleep(2)
+            logger.warning(f"Error waiting for response - returning partial response: {e}")
+            break
+    
+    # Read the final text once
+    try:
+        responses = await page.query_selector_all('div[data-message-author-role="assistant"]')
+        if responses:
+            return await responses[-1].inner_text() or None
+    except Exception as e:
+        logger.warning(f"Error reading response: {e}")
+    
+    return None
 
 
 def extract_json_from_response(response_text: str) -> Optional[dict]:
@@ -210,35 +236,25 @@ def extract_json_from_response(response_text: str) -> Optional[dict]:
     Extract JSON from ChatGPT response text.
     Handles JSON in code blocks or raw JSON.
     """
-    import re
-    
     if not response_text:
         return None
     
-    # Try to find JSON in code blocks first
-    code_block_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    matches = re.findall(code_block_pattern, response_text)
-    
-    for match in matches:
+    # Try the contents of each fenced code block first
+    for match in _CODE_BLOCK_RE.finditer(response_text):
         try:
-            return json.loads(match)
+            return json.loads(match.group(1))
         except json.JSONDecodeError:
             continue
     
-    # Try to find raw JSON (starts with { and ends with })
+    # Then the raw object starting at the first brace; nested objects are
+    # never tried on their own, so a truncated response yields None
     start = response_text.find('{')
     if start != -1:
-        depth = 0
-        for i, char in enumerate(response_text[start:], start):
-            if char == '{':
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    try:
-                        return json.loads(response_text[start:i+1])
-                    except json.JSONDecodeError:
-                        break
+        try:
+            obj, _ = _DECODER.raw_decode(response_text, start)
+            return obj
+        except json.JSONDecodeError:
+            pass
     
     return None
 
@@ -288,16 +304,16 @@ async def analyze_with_chatgpt(
             await context.add_cookies(saved_cookies)
         
         page = await context.new_page()
+        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
         
         try:
             # Navigate to ChatGPT
             logger.info("Navigating to ChatGPT...")
-            await page.goto(CHATGPT_NEW_CHAT_URL, wait_until="networkidle", timeout=60000)
-            
-            await asyncio.sleep(2)
+            await page.goto(CHATGPT_NEW_CHAT_URL, wait_until="domcontentloaded")
+            await wait_for_page_ready(page)
             
             # Check if we need to login
-            chat_input = await page.query_selector('textarea[id="prompt-textarea"], div[id="prompt-textarea"]')
+            chat_input = await page.query_selector(CHAT_INPUT_SELECTOR)
             
             if not chat_input:
                 # Need to login
@@ -369,13 +385,14 @@ async def test_chatgpt_connection(headless: bool = False) -> bool:
             await context.add_cookies(saved_cookies)
         
         page = await context.new_page()
+        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
         
         try:
-            await page.goto(CHATGPT_URL, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(2)
+            await page.goto(CHATGPT_URL, wait_until="domcontentloaded")
+            await wait_for_page_ready(page)
             
             # Check if logged in
-            chat_input = await page.query_selector('textarea[id="prompt-textarea"], div[id="prompt-textarea"]')
+            chat_input = await page.query_selector(CHAT_INPUT_SELECTOR)
             
             await browser.close()
             return chat_input is not None
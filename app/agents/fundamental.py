@@ -1,10 +1,14 @@
 """Fundamental data ingestion - ForexFactory calendar scraper."""
 
+import asyncio
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html as lhtml
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
 from app.models import EconomicEvent
@@ -14,26 +18,83 @@ from app.config import DANGER_WINDOW_MINUTES
 # ForexFactory calendar URL pattern
 FF_CALENDAR_URL = "https://www.forexfactory.com/calendar"
 
+# Max rows per multi-row INSERT (keeps statements under SQLite's bind-parameter limit)
+INSERT_BATCH_SIZE = 1000
+
+MONTH_NAMES = ("jan", "feb", "mar", "apr", "may", "jun",
+               "jul", "aug", "sep", "oct", "nov", "dec")
+
+# Calendar cell formats, e.g. "MonDec 16" / "Dec 16" and "8:30am"
+_DATE_FMT1 = "%a%b %d %Y"
+_DATE_FMT2 = "%b %d %Y"
+_TIME_FMT = "%I:%M%p"
+
+_MIDNIGHT = datetime.min.time()
+_EOD = datetime.max.time()
+
+# Currencies kept from the calendar
+_USD_EUR = frozenset(("USD", "EUR"))
+
+
+def _has_class(cls: str) -> str:
+    """XPath predicate true for elements carrying CSS class `cls`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+def _class_xpath(path: str, tag: str, cls: str) -> etree.XPath:
+    """Compile an XPath matching `tag` elements carrying CSS class `cls`."""
+    return etree.XPath(f"{path}{tag}[{_has_class(cls)}]")
+
+
+# Calendar selectors, compiled once and evaluated per row in C.
+# Rows are pre-filtered to those that start a new day (date cell) or are
+# USD/EUR events, so most foreign-currency rows never reach Python. The
+# currency is upper-cased with translate() (XPath 1.0 has no upper-case()),
+# matching the Python-side currency.upper().
+_UPPER_CURRENCY = "translate(normalize-space(), 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')"
+_ROWS = etree.XPath(
+    f"//tr[{_has_class('calendar__row')}]"
+    f"[.//td[{_has_class('calendar__date')}][normalize-space()]"
+    f" or .//td[{_has_class('calendar__currency')}]"
+    f"[{' or '.join(f'{_UPPER_CURRENCY}={c!r}' for c in sorted(_USD_EUR))}]]"
+)
+_DATE_CELL = _class_xpath(".//", "td", "calendar__date")
+_CURRENCY_CELL = _class_xpath(".//", "td", "calendar__currency")
+_IMPACT_CELL = _class_xpath(".//", "td", "calendar__impact")
+_TIME_CELL = _class_xpath(".//", "td", "calendar__time")
+_EVENT_CELL = _class_xpath(".//", "td", "calendar__event")
+_FORECAST_CELL = _class_xpath(".//", "td", "calendar__forecast")
+_PREVIOUS_CELL = _class_xpath(".//", "td", "calendar__previous")
+_ACTUAL_CELL = _class_xpath(".//", "td", "calendar__actual")
+_IMPACT_CLASS = etree.XPath("string(.//span/@class)")
+
+
+def _cell_text(row, selector: etree.XPath) -> Optional[str]:
+    """Stripped text of the first matching cell, or None if there is no cell."""
+    cells = selector(row)
+    if not cells:
+        return None
+    return "".join(t.strip() for t in cells[0].itertext())
+
+
+@lru_cache(maxsize=2048)
+def _parse_time(time_text: str) -> time:
+    """Parse a calendar time cell; the set of distinct values is small."""
+    return datetime.strptime(time_text, _TIME_FMT).time()
+
 
 def get_month_url(year: int, month: int) -> str:
     """Generate ForexFactory URL for a specific month."""
-    month_names = ["jan", "feb", "mar", "apr", "may", "jun", 
-                   "jul", "aug", "sep", "oct", "nov", "dec"]
-    month_str = month_names[month - 1]
+    month_str = MONTH_NAMES[month - 1]
     return f"{FF_CALENDAR_URL}?month={month_str}.{year}"
 
 
-async def fetch_calendar_page(url: str) -> Optional[str]:
+async def fetch_calendar_page(client: httpx.AsyncClient, url: str) -> Optional[str]:
     """Fetch calendar page HTML."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    }
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.text
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.text
     except Exception as e:
         print(f"Error fetching {url}: {e}")
         return None
@@ -47,92 +108,75 @@ def parse_calendar_html(html: str, year: int) -> List[dict]:
     to extract the key fields but may need updates if the site changes.
     """
     events = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    # Find calendar table rows
-    rows = soup.select("tr.calendar__row")
+    tree = lhtml.fromstring(html)
     
     current_date = None
     
-    for row in rows:
+    for row in _ROWS(tree):
         try:
             # Check for date cell
-            date_cell = row.select_one("td.calendar__date")
-            if date_cell:
-                date_text = date_cell.get_text(strip=True)
-                if date_text:
-                    # Parse date (format varies: "Mon Dec 16" or similar)
+            date_text = _cell_text(row, _DATE_CELL)
+            if date_text:
+                # Parse date (format varies: "Mon Dec 16" or similar)
+                try:
+                    # Try to parse the date
+                    parsed = datetime.strptime(f"{date_text} {year}", _DATE_FMT1)
+                    current_date = parsed.date()
+                except ValueError:
                     try:
-                        # Try to parse the date
-                        parsed = datetime.strptime(f"{date_text} {year}", "%a%b %d %Y")
+                        parsed = datetime.strptime(f"{date_text} {year}", _DATE_FMT2)
                         current_date = parsed.date()
                     except ValueError:
-                        try:
-                            parsed = datetime.strptime(f"{date_text} {year}", "%b %d %Y")
-                            current_date = parsed.date()
-                        except ValueError:
-                            pass
+                        pass
             
             if not current_date:
                 continue
             
             # Get currency
-            currency_cell = row.select_one("td.calendar__currency")
-            if not currency_cell:
+            currency = _cell_text(row, _CURRENCY_CELL)
+            if currency is None:
                 continue
-            currency = currency_cell.get_text(strip=True).upper()
+            currency = currency.upper()
             
             # Only interested in USD and EUR
-            if currency not in ["USD", "EUR"]:
+            if currency not in _USD_EUR:
                 continue
             
             # Get impact
-            impact_cell = row.select_one("td.calendar__impact")
             impact = "low"
-            if impact_cell:
-                impact_span = impact_cell.select_one("span")
-                if impact_span:
-                    classes = impact_span.get("class", [])
-                    if any("high" in c for c in classes):
-                        impact = "high"
-                    elif any("medium" in c for c in classes):
-                        impact = "medium"
+            impact_cells = _IMPACT_CELL(row)
+            if impact_cells:
+                classes = _IMPACT_CLASS(impact_cells[0]).split()
+                if any("high" in c for c in classes):
+                    impact = "high"
+                elif any("medium" in c for c in classes):
+                    impact = "medium"
             
             # Get time
-            time_cell = row.select_one("td.calendar__time")
+            time_text = _cell_text(row, _TIME_CELL)
             event_time = None
-            if time_cell:
-                time_text = time_cell.get_text(strip=True)
+            if time_text is not None:
                 if time_text and time_text not in ["", "All Day", "Tentative"]:
                     try:
                         # Parse time (format: "8:30am" or "2:00pm")
-                        time_parsed = datetime.strptime(time_text.lower(), "%I:%M%p")
-                        event_time = datetime.combine(current_date, time_parsed.time())
+                        event_time = datetime.combine(current_date, _parse_time(time_text.lower()))
                     except ValueError:
-                        event_time = datetime.combine(current_date, datetime.min.time())
+                        event_time = datetime.combine(current_date, _MIDNIGHT)
                 else:
-                    event_time = datetime.combine(current_date, datetime.min.time())
+                    event_time = datetime.combine(current_date, _MIDNIGHT)
             
             if not event_time:
-                event_time = datetime.combine(current_date, datetime.min.time())
+                event_time = datetime.combine(current_date, _MIDNIGHT)
             
             # Get event title
-            event_cell = row.select_one("td.calendar__event")
-            if not event_cell:
-                continue
-            title = event_cell.get_text(strip=True)
+            title = _cell_text(row, _EVENT_CELL)
             if not title:
                 continue
             
             # Get forecast, previous, actual
-            forecast_cell = row.select_one("td.calendar__forecast")
-            forecast = forecast_cell.get_text(strip=True) if forecast_cell else None
-            
-            previous_cell = row.select_one("td.calendar__previous")
-            previous = previous_cell.get_text(strip=True) if previous_cell else None
-            
-            actual_cell = row.select_one("td.calendar__actual")
-            actual = actual_cell.get_text(strip=True) if actual_cell else None
+            forecast = _cell_text(row, _FORECAST_CELL)
+            previous = _cell_text(row, _PREVIOUS_CELL)
+            actual = _cell_text(row, _ACTUAL_CELL)
             
             events.append({
                 "event_time_utc": event_time,
@@ -173,49 +217,120 @@ async def fetch_and_store_calendar(db: Session) -> dict:
         prev_month = (now.year, now.month - 1)
     
     months_to_fetch = [prev_month, current_month]
+    stamp = datetime.utcnow()
     
-    for year, month in months_to_fetch:
-        url = get_month_url(year, month)
-        html = await fetch_calendar_page(url)
-        
+    # One pooled HTTP/2 connection serves both month pages, fetched concurrently
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+        },
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    ) as client:
+        pages = await asyncio.gather(*(
+            fetch_calendar_page(client, get_month_url(year, month))
+            for year, month in months_to_fetch
+        ))
+    
+    for (year, month), html in zip(months_to_fetch, pages):
         if not html:
-            results["errors"].append(f"Failed to fetch {url}")
+            results["errors"].append(f"Failed to fetch {get_month_url(year, month)}")
             continue
         
         events = parse_calendar_html(html, year)
         results["fetched"] += len(events)
         
-        for event_data in events:
-            # Check if event already exists
-            existing = db.query(EconomicEvent).filter(
-                EconomicEvent.event_time_utc == event_data["event_time_utc"],
-                EconomicEvent.currency == event_data["currency"],
-                EconomicEvent.title == event_data["title"]
-            ).first()
-            
-            if existing:
-                # Update if actual value changed
-                if event_data["actual"] and existing.actual != event_data["actual"]:
-                    existing.actual = event_data["actual"]
-                    existing.updated_at = datetime.utcnow()
-                    results["updated"] += 1
-            else:
-                # Insert new event
-                event = EconomicEvent(**event_data, source="forexfactory")
-                db.add(event)
-                results["inserted"] += 1
+        if not events:
+            continue
+        
+        # One entry per event identity (the unique index rejects repeats in a batch)
+        scraped = {(e["event_time_utc"], e["currency"], e["title"]): e for e in events}
+        
+        # Load what is already stored for this window in a single query
+        min_t = min(key[0] for key in scraped)
+        max_t = max(key[0] for key in scraped)
+        existing = {
+            (r.event_time_utc, r.currency, r.title): r
+            for r in db.query(
+                EconomicEvent.event_time_utc,
+                EconomicEvent.currency,
+                EconomicEvent.title,
+                EconomicEvent.id,
+                EconomicEvent.actual,
+            ).filter(
+                EconomicEvent.event_time_utc.between(min_t, max_t),
+                EconomicEvent.currency.in_(_USD_EUR),
+            ).all()
+        }
+        
+        to_insert = []
+        to_update = []
+        for key, event_data in scraped.items():
+            stored = existing.get(key)
+            if stored is None:
+                to_insert.append({
+                    **event_data,
+                    "source": "forexfactory",
+                    "created_at": stamp,
+                    "updated_at": stamp,
+                })
+            elif event_data["actual"] and stored.actual != event_data["actual"]:
+                to_update.append({
+                    "id": stored.id,
+                    "actual": event_data["actual"],
+                    "updated_at": stamp,
+                })
+        
+        # Insert new events in batches; the identity index guards against a
+        # concurrent scrape having stored them in the meantime (rowcount only
+        # counts the rows actually inserted)
+        inserted = 0
+        for i in range(0, len(to_insert), INSERT_BATCH_SIZE):
+            stmt = insert(EconomicEvent).values(to_insert[i:i + INSERT_BATCH_SIZE])
+            inserted += db.execute(stmt.on_conflict_do_nothing(
+                index_elements=["event_time_utc", "currency", "title"]
+            )).rowcount
+        
+        # Published actual values: one executemany UPDATE keyed by primary key
+        if to_update:
+            db.execute(update(EconomicEvent), to_update)
+        
+        results["inserted"] += inserted
+        results["updated"] += len(to_update)
     
     db.commit()
     return results
 
 
-def get_todays_events(db: Session, currencies: List[str] = None) -> List[EconomicEvent]:
-    """Get today's economic events, optionally filtered by currency."""
-    today = datetime.now().date()
-    start = datetime.combine(today, datetime.min.time())
-    end = datetime.combine(today, datetime.max.time())
+def get_todays_events(
+    db: Session,
+    currencies: List[str] = None,
+    target_date: datetime.date = None,
+) -> list:
+    """
+    Get the economic events of target_date (default: today, UTC), optionally
+    filtered by currency.
+    Returns lightweight rows exposing id, event_time_utc, currency, impact,
+    title, forecast, previous and actual.
+    """
+    # event_time_utc holds naive UTC, so the day boundaries are UTC too
+    if target_date is None:
+        target_date = datetime.now(timezone.utc).date()
+    start = datetime.combine(target_date, _MIDNIGHT)
+    end = datetime.combine(target_date, _EOD)
     
-    query = db.query(EconomicEvent).filter(
+    # Column rows (not ORM objects) - callers only render these fields
+    query = select(
+        EconomicEvent.id,
+        EconomicEvent.event_time_utc,
+        EconomicEvent.currency,
+        EconomicEvent.impact,
+        EconomicEvent.title,
+        EconomicEvent.forecast,
+        EconomicEvent.previous,
+        EconomicEvent.actual,
+    ).filter(
         EconomicEvent.event_time_utc >= start,
         EconomicEvent.event_time_utc <= end
     )
@@ -223,26 +338,33 @@ def get_todays_events(db: Session, currencies: List[str] = None) -> List[Economi
     if currencies:
         query = query.filter(EconomicEvent.currency.in_(currencies))
     
-    return query.order_by(EconomicEvent.event_time_utc).all()
+    return db.execute(query.order_by(EconomicEvent.event_time_utc)).all()
 
 
 def get_danger_windows(db: Session, target_date: datetime.date = None) -> List[dict]:
     """
     Get danger windows around high-impact events.
-    Returns list of {start, end, event} dicts.
+    Returns list of {start, end, event} dicts, where event is a lightweight
+    row exposing id, event_time_utc, title and currency.
     """
     if target_date is None:
-        target_date = datetime.now().date()
+        target_date = datetime.now(timezone.utc).date()
     
-    start = datetime.combine(target_date, datetime.min.time())
-    end = datetime.combine(target_date, datetime.max.time())
+    start = datetime.combine(target_date, _MIDNIGHT)
+    end = datetime.combine(target_date, _EOD)
     
-    high_impact = db.query(EconomicEvent).filter(
+    # Column rows (not ORM objects) - callers only read the event's time/title/currency
+    high_impact = db.execute(select(
+        EconomicEvent.id,
+        EconomicEvent.event_time_utc,
+        EconomicEvent.title,
+        EconomicEvent.currency,
+    ).filter(
         EconomicEvent.event_time_utc >= start,
         EconomicEvent.event_time_utc <= end,
         EconomicEvent.impact == "high",
-        EconomicEvent.currency.in_(["USD", "EUR"])
-    ).all()
+        EconomicEvent.currency.in_(_USD_EUR)
+    )).all()
     
     windows = []
     delta = timedelta(minutes=DANGER_WINDOW_MINUTES)
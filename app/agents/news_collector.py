@@ -1,14 +1,25 @@
 """News collector - fetches Fed/FOMC related news from official sources."""
 
+import asyncio
+import hashlib
+import logging
 import re
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import List, Optional
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html as lhtml
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
 from app.models import NewsItem
 
+logger = logging.getLogger(__name__)
+
 
 # Keywords for hawkish/dovish classification
 HAWKISH_KEYWORDS = [
@@ -32,16 +43,247 @@ FOMC_KEYWORDS = ["fomc", "federal open market", "monetary policy", "interest rat
 SPEECH_KEYWORDS = ["speech", "remarks", "testimony", "chair powell", "governor"]
 ECONOMIC_KEYWORDS = ["inflation", "employment", "gdp", "economic", "beige book"]
 
+# Date patterns, compiled once: the YYYYMMDD stamp in Fed URLs
+# (monetary20251217a.htm) and the text formats tried in order on listing items
+_DATE_URL_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+_DATE_TEXT_RES = (
+    re.compile(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}"),
+    re.compile(r"\d{1,2}/\d{1,2}/\d{4}"),
+)
+
+# Non-ISO Fed date shapes -> the strptime formats that can match them
+# (shapes are as loose as strptime itself: flexible spaces, unpadded digits)
+_D = r"\s?\d{1,2}"
+_FED_DATE_SHAPES = (
+    (re.compile(rf"[a-z]+\s+{_D},\s+\d{{4}}", re.IGNORECASE), ("%B %d, %Y", "%b %d, %Y")),  # December 17, 2025 / Dec 17, 2025
+    (re.compile(rf"[a-z]+\s+{_D}\s+\d{{4}}", re.IGNORECASE), ("%B %d %Y",)),  # December 17 2025
+    (re.compile(rf"{_D}/{_D}/\d{{4}}"), ("%m/%d/%Y",)),  # 12/17/2025
+    (re.compile(rf"\d{{4}}-{_D}-{_D}"), ("%Y-%m-%d",)),  # 2025-1-7
+    (re.compile(rf"\d{{4}}-{_D}-{_D}T\d{{1,2}}:\d{{1,2}}:\d{{1,2}}"), ("%Y-%m-%dT%H:%M:%S",)),
+)
+
+# Bytes handed to the HTML parser per read while a page streams in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Responses larger than this, or that aren't HTML/XML, are dropped unparsed
+MAX_PAGE_BYTES = 2_000_000
+_PAGE_CONTENT_TYPES = ("html", "xml")
+
+# Link texts that mark an FOMC meeting document
+_FOMC_LINK_TERMS = ("statement", "minutes", "press conference", "projection", "implementation note")
+
+# Max statement pages fetched at once when backfilling FOMC history
+STATEMENT_FETCH_CONCURRENCY = 8
+
+# Max rows per multi-row INSERT (keeps statements under SQLite's bind-parameter limit)
+INSERT_BATCH_SIZE = 1000
+
+
+# One shared client for every Fed request: all URLs live on the same host,
+# so a single pooled HTTP/2 connection replaces a TLS handshake per fetch
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Fed client, creating it for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    # Connections are bound to the loop that opened them (run.py uses one
+    # asyncio.run per command), so start a fresh client on a new loop
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+            timeout=30.0,
+            headers=_DEFAULT_HEADERS,
+        )
+        _client_loop = loop
+    return _client
+
+
+def _client_is_live() -> bool:
+    """Whether the shared client is open and bound to the running event loop."""
+    return (
+        _client is not None
+        and not _client.is_closed
+        and _client_loop is asyncio.get_running_loop()
+    )
+
+
+async def open_client():
+    """Open the shared Fed client for the running loop (called on app startup)."""
+    _get_client()
+
+
+async def close_client():
+    """Close the shared Fed client (called on app shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+@asynccontextmanager
+async def _client_scope():
+    """
+    Keep the shared client for the length of a top-level fetch. A client
+    opened here (CLI runs, one asyncio.run per command) is closed on exit;
+    one already open for this loop (the app server's) is left open.
+    """
+    owned = not _client_is_live()
+    try:
+        yield
+    finally:
+        if owned:
+            await close_client()
+
+
+def _has_class(*classes: str) -> str:
+    """XPath predicate true for elements carrying every CSS class in `classes`."""
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')" for cls in classes
+    )
+
+
+# Fed page selectors, compiled once and evaluated by libxml2
+_RELEASE_ROWS = etree.XPath(f"//div[{_has_class('row')}]")
+_RELEASE_DATES = etree.XPath(
+    f".//time | .//*[{_has_class('itemDate')}] | .//p[{_has_class('news-date')}]"
+)
+_NEWS_DIVS = etree.XPath(
+    f"//div[{_has_class('news-item')}] | //div[{_has_class('eventlist')}]"
+    f" | //*[{_has_class('panel-body')}]"
+)
+_FIRST_LINK = etree.XPath("(.//a)[1]")
+_ALL_LINKS = etree.XPath(".//a")
+_HREF_LINKS = etree.XPath("//a[@href]")
+_MEETING_ROWS = etree.XPath(
+    f"//div[{_has_class('panel')}] | //div[{_has_class('fomc-meeting')}] | //tr"
+)
+_CONTENT_AREAS = (
+    etree.XPath(f"(//div[{_has_class('col-xs-12', 'col-sm-8', 'col-md-8')}])[1]"),
+    etree.XPath("(//div[@id='article'])[1]"),
+    etree.XPath("(//article)[1]"),
+    etree.XPath(f"(//div[{_has_class('content')}])[1]"),
+    etree.XPath("(//main)[1]"),
+)
+_BODY = etree.XPath("(//body)[1]")
+_CONTENT_NOISE = etree.XPath(".//script | .//style | .//nav | .//footer")
+_BODY_NOISE = etree.XPath(".//script | .//style | .//nav | .//footer | .//header")
+
+# Text inside these tags is not page text (matches BeautifulSoup's get_text)
+_NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def _first(selector: etree.XPath, elem):
+    """First match of `selector` under `elem`, or None."""
+    matches = selector(elem)
+    return matches[0] if matches else None
+
+
+def _date_priority(elem) -> int:
+    """Rank date candidates: <time>, then .itemDate, then p.news-date."""
+    if elem.tag == "time":
+        return 0
+    return 1 if "itemDate" in (elem.get("class") or "").split() else 2
+
+
+def _release_date_elem(item):
+    """Date element of a release row, found with a single XPath evaluation."""
+    candidates = _RELEASE_DATES(item)
+    # min() keeps document order among equally ranked candidates
+    return min(candidates, key=_date_priority) if candidates else None
+
+
+def _strings(elem):
+    """Yield the text fragments under `elem` in document order."""
+    if isinstance(elem.tag, str) and elem.tag not in _NON_TEXT_TAGS and elem.text:
+        yield elem.text
+    for child in elem:
+        yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(elem, separator: str = "", strip: bool = True) -> str:
+    """Text content of `elem`, with the same semantics as bs4's get_text."""
+    if not strip:
+        return separator.join(_strings(elem))
+    return separator.join(s for s in (s.strip() for s in _strings(elem)) if s)
+
+
+_HAWKISH_SET = frozenset(HAWKISH_KEYWORDS)
+_DOVISH_SET = frozenset(DOVISH_KEYWORDS)
+_STANCE_KEYWORDS = sorted(_HAWKISH_SET | _DOVISH_SET)
+
+
+def _build_hyperscan_db():
+    """
+    Compile the stance keywords into a Hyperscan (SIMD) database.
+    Returns None when the optional hyperscan package is not installed.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(kw).encode() for kw in _STANCE_KEYWORDS],
+        ids=list(range(len(_STANCE_KEYWORDS))),
+        elements=len(_STANCE_KEYWORDS),
+        # Distinct keywords are counted, so one report per keyword is enough
+        flags=hyperscan.HS_FLAG_SINGLEMATCH,
+    )
+    return db
+
+
+_STANCE_HS_DB = _build_hyperscan_db()
+_hs_local = threading.local()
+
+
+def _hs_scratch():
+    """Per-thread Hyperscan scratch space (one scratch can't serve concurrent scans)."""
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        import hyperscan
+        scratch = _hs_local.scratch = hyperscan.Scratch(_STANCE_HS_DB)
+    return scratch
+
+
+def _find_stance_keywords(text_lower: str) -> set:
+    """Return the distinct hawkish/dovish keywords present in `text_lower`."""
+    if _STANCE_HS_DB is None:
+        # str.__contains__ is a C fast search, cheaper than any pure-Python
+        # or stdlib-regex multi-pattern scan at this keyword count
+        return {kw for kw in _STANCE_KEYWORDS if kw in text_lower}
+    
+    found = set()
+    _STANCE_HS_DB.scan(
+        text_lower.encode(),
+        match_event_handler=lambda kw_id, start, end, flags, context: found.add(_STANCE_KEYWORDS[kw_id]),
+        scratch=_hs_scratch(),
+    )
+    return found
+
 
 def classify_stance(text: str) -> tuple:
     """
     Simple keyword-based stance classification.
     Returns (stance, confidence) where stance is hawkish/dovish/neutral.
     """
-    text_lower = text.lower()
+    found = _find_stance_keywords(text.lower())
     
-    hawkish_count = sum(1 for kw in HAWKISH_KEYWORDS if kw in text_lower)
-    dovish_count = sum(1 for kw in DOVISH_KEYWORDS if kw in text_lower)
+    hawkish_count = len(found & _HAWKISH_SET)
+    dovish_count = len(found & _DOVISH_SET)
     
     total = hawkish_count + dovish_count
     if total == 0:
@@ -57,18 +299,291 @@ def classify_stance(text: str) -> tuple:
         return ("neutral", 40)
 
 
+# Titles repeat across the press release, RSS and calendar scrapers, so
+# title lookups are cached; statement bodies are large and seen once
+_classify_title = lru_cache(maxsize=4096)(classify_stance)
+
+
+# One alternation per category, checked in precedence order (a single fused
+# alternation would report the leftmost keyword, not the strongest category)
+_CATEGORY_PATTERNS = tuple(
+    (re.compile("|".join(map(re.escape, keywords))), category)
+    for keywords, category in (
+        (FOMC_KEYWORDS, "FOMC"),
+        (SPEECH_KEYWORDS, "Speech"),
+        (ECONOMIC_KEYWORDS, "Economic Data"),
+    )
+)
+
+
+@lru_cache(maxsize=4096)
 def categorize_release(title: str) -> str:
     """Categorize a Fed release by type."""
     title_lower = title.lower()
     
-    if any(kw in title_lower for kw in FOMC_KEYWORDS):
-        return "FOMC"
-    elif any(kw in title_lower for kw in SPEECH_KEYWORDS):
-        return "Speech"
-    elif any(kw in title_lower for kw in ECONOMIC_KEYWORDS):
-        return "Economic Data"
-    else:
-        return "Other"
+    for pattern, category in _CATEGORY_PATTERNS:
+        if pattern.search(title_lower):
+            return category
+    return "Other"
+
+
+def _unwanted_response(response: httpx.Response) -> bool:
+    """True when the headers announce a body that isn't a page we can use."""
+    content_type = response.headers.get("Content-Type", "")
+    if content_type and not any(t in content_type for t in _PAGE_CONTENT_TYPES):
+        return True
+    length = response.headers.get("Content-Length", "")
+    return length.isdigit() and int(length) > MAX_PAGE_BYTES
+
+
+async def _stream_into(response: httpx.Response, parser, digest=None) -> bool:
+    """
+    Feed the body into `parser` (and `digest`) as it arrives.
+    Returns False, having stopped reading, once it exceeds MAX_PAGE_BYTES.
+    """
+    received = 0
+    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+        received += len(chunk)
+        if received > MAX_PAGE_BYTES:
+            return False
+        parser.feed(chunk)
+        if digest is not None:
+            digest.update(chunk)
+    return True
+
+
+async def _fetch_tree(client: httpx.AsyncClient, url: str):
+    """
+    Stream a page into lxml's incremental HTML parser, so parsing overlaps
+    the download and the body is never held as one decoded str.
+    Returns the document root, or None for a non-200 or oversized response.
+    """
+    async with client.stream("GET", url) as response:
+        if response.status_code != 200 or _unwanted_response(response):
+            return None
+        
+        parser = lhtml.HTMLParser(encoding=response.encoding)
+        if not await _stream_into(response, parser):
+            return None
+        return parser.close()
+
+
+# Listing pages rarely change between polls. Per page (keyed by URL unless the
+# caller's parse depends on more): (etag, last_modified, body_hash, items)
+# from the last 200 response; items stays None until the page is parsed.
+_URL_CACHE: dict = {}
+
+
+async def _fetch_page(client: httpx.AsyncClient, url: str, cache_key=None, xml: bool = False) -> tuple:
+    """
+    Conditionally GET a listing page, streaming it into lxml while hashing it.
+    Returns (None, items) when the items cached for the page still apply (a
+    304, or a body identical to the last one), (root, None) when it has to be
+    parsed - hand the parsed items to _cache_items - and (None, None) for any
+    other status or an oversized / non-HTML response.
+    """
+    key = cache_key or url
+    cached = _URL_CACHE.get(key)
+    if cached is not None and cached[3] is None:
+        cached = None
+    
+    headers = {}
+    if cached is not None:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304 and cached is not None:
+            return None, list(cached[3])
+        if response.status_code != 200 or _unwanted_response(response):
+            return None, None
+        
+        if xml:
+            parser = etree.XMLParser(recover=True)
+        else:
+            parser = lhtml.HTMLParser(encoding=response.encoding)
+        digest = hashlib.blake2b()
+        if not await _stream_into(response, parser, digest):
+            return None, None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+    
+    body_hash = digest.hexdigest()
+    if cached is not None and cached[2] == body_hash:
+        # Same bytes as last time (server without validators): skip the parse
+        _URL_CACHE[key] = (etag, last_modified, body_hash, cached[3])
+        return None, list(cached[3])
+    
+    _URL_CACHE[key] = (etag, last_modified, body_hash, None)
+    return parser.close(), None
+
+
+def _cache_items(url: str, items: List[dict], cache_key=None):
+    """Record the items parsed from a page fetched with _fetch_page."""
+    key = cache_key or url
+    entry = _URL_CACHE.get(key)
+    if entry is not None:
+        _URL_CACHE[key] = (entry[0], entry[1], entry[2], list(items))
+
+
+# When several sources list the same URL, keep the most specific label
+_SOURCE_PRIORITY = {
+    "Federal Reserve (FOMC)": 3,
+    "Federal Reserve (Speech)": 2,
+    "Federal Reserve (Economic Data)": 1,
+}
+
+
+def _dedupe_by_url(items: List[dict]) -> List[dict]:
+    """
+    Drop repeated URLs in one pass, in first-seen order. For a repeated URL
+    the item with the higher-priority source wins (the first one on a tie).
+    """
+    unique = {}
+    for item in items:
+        kept = unique.setdefault(item["url"], item)
+        if kept is not item and (
+            _SOURCE_PRIORITY.get(item["source"], 0) > _SOURCE_PRIORITY.get(kept["source"], 0)
+        ):
+            unique[item["url"]] = item
+    return list(unique.values())
+
+
+async def _fetch_press_release_page(client: httpx.AsyncClient, url: str) -> List[dict]:
+    """Fetch one press release listing page and parse the releases on it."""
+    news_items = []
+    
+    try:
+        tree, cached = await _fetch_page(client, url)
+        if cached is not None:
+            return cached
+        if tree is None:
+            return news_items
+        
+        # Method 1: Look for press release list items
+        # Fed website typically uses div.row or similar for each release
+        items = _RELEASE_ROWS(tree)
+        
+        for item in items:
+            try:
+                link_elem = _first(_FIRST_LINK, item)
+                
+                if link_elem is None:
+                    continue
+                
+                title = _text(link_elem)
+                if not title or len(title) < 10:
+                    continue
+                
+                href = link_elem.get("href", "")
+                if not href:
+                    continue
+                if not href.startswith("http"):
+                    href = f"https://www.federalreserve.gov{href}"
+                
+                # Skip non-press-release links
+                if "/pressreleases/" not in href and "/newsevents/" not in href:
+                    continue
+                
+                # Parse date - Fed uses various formats (looked up only for
+                # rows that survived the cheap title/URL checks above)
+                pub_date = None
+                date_elem = _release_date_elem(item)
+                if date_elem is not None:
+                    date_str = date_elem.get("datetime") or _text(date_elem)
+                    pub_date = parse_fed_date(date_str)
+                
+                if not pub_date:
+                    # Try to extract date from URL (format: monetary20251217a.htm)
+                    date_match = _DATE_URL_RE.search(href)
+                    if date_match:
+                        try:
+                            pub_date = datetime(
+                                int(date_match.group(1)),
+                                int(date_match.group(2)),
+                                int(date_match.group(3))
+                            )
+                        except ValueError:
+                            pass
+                
+                if not pub_date:
+                    pub_date = datetime.now()
+                
+                # Categorize the release
+                category = categorize_release(title)
+                
+                news_items.append({
+                    "published_at": pub_date,
+                    "source": f"Federal Reserve ({category})",
+                    "title": title,
+                    "url": href,
+                })
+                
+            except Exception:
+                continue
+        
+        # Method 2: Look for news-item divs
+        news_divs = _NEWS_DIVS(tree)
+        for item in news_divs:
+            try:
+                link_elem = _first(_FIRST_LINK, item)
+                if link_elem is None:
+                    continue
+                
+                title = _text(link_elem)
+                href = link_elem.get("href", "")
+                
+                if not title or not href or len(title) < 10:
+                    continue
+                
+                if not href.startswith("http"):
+                    href = f"https://www.federalreserve.gov{href}"
+                
+                # Extract date from surrounding text or URL
+                pub_date = None
+                date_text = _text(item, strip=False)
+                for pattern in _DATE_TEXT_RES:
+                    match = pattern.search(date_text)
+                    if match:
+                        pub_date = parse_fed_date(match.group())
+                        break
+                
+                if not pub_date:
+                    date_match = _DATE_URL_RE.search(href)
+                    if date_match:
+                        try:
+                            pub_date = datetime(
+                                int(date_match.group(1)),
+                                int(date_match.group(2)),
+                                int(date_match.group(3))
+                            )
+                        except ValueError:
+                            pub_date = datetime.now()
+                
+                if not pub_date:
+                    pub_date = datetime.now()
+                
+                category = categorize_release(title)
+                
+                news_items.append({
+                    "published_at": pub_date,
+                    "source": f"Federal Reserve ({category})",
+                    "title": title,
+                    "url": href,
+                })
+                
+            except Exception:
+                continue
+        
+        _cache_items(url, news_items)
+        
+    except Exception as e:
+        logger.warning(f"Error fetching {url}: {e}")
+    
+    return news_items
 
 
 async def fetch_fed_press_releases(year: int = None) -> List[dict]:
@@ -78,8 +593,6 @@ async def fetch_fed_press_releases(year: int = None) -> List[dict]:
     
     The page uses server-side rendering, we parse the HTML directly.
     """
-    news_items = []
-    
     if year is None:
         year = datetime.now().year
     
@@ -90,153 +603,13 @@ async def fetch_fed_press_releases(year: int = None) -> List[dict]:
         f"https://www.federalreserve.gov/newsevents/pressreleases/{year}-monetary.htm",
     ]
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
+    client = _get_client()
+    pages = await asyncio.gather(
+        *(_fetch_press_release_page(client, url) for url in urls)
+    )
+    news_items = [item for items in pages for item in items]
     
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for url in urls:
-            try:
-                response = await client.get(url, headers=headers, timeout=30.0)
-                if response.status_code != 200:
-                    continue
-                
-                soup = BeautifulSoup(response.text, "lxml")
-                
-                # Method 1: Look for press release list items
-                # Fed website typically uses div.row or similar for each release
-                items = soup.select("div.row")
-                
-                for item in items:
-                    try:
-                        # Look for date - Fed uses various formats
-                        date_elem = item.select_one("time") or item.select_one(".itemDate") or item.select_one("p.news-date")
-                        link_elem = item.select_one("a")
-                        
-                        if not link_elem:
-                            continue
-                        
-                        title = link_elem.get_text(strip=True)
-                        if not title or len(title) < 10:
-                            continue
-                        
-                        href = link_elem.get("href", "")
-                        if not href:
-                            continue
-                        if not href.startswith("http"):
-                            href = f"https://www.federalreserve.gov{href}"
-                        
-                        # Skip non-press-release links
-                        if "/pressreleases/" not in href and "/newsevents/" not in href:
-                            continue
-                        
-                        # Parse date
-                        pub_date = None
-                        if date_elem:
-                            date_str = date_elem.get("datetime") or date_elem.get_text(strip=True)
-                            pub_date = parse_fed_date(date_str)
-                        
-                        if not pub_date:
-                            # Try to extract date from URL (format: monetary20251217a.htm)
-                            date_match = re.search(r'(\d{4})(\d{2})(\d{2})', href)
-                            if date_match:
-                                try:
-                                    pub_date = datetime(
-                                        int(date_match.group(1)),
-                                        int(date_match.group(2)),
-                                        int(date_match.group(3))
-                                    )
-                                except ValueError:
-                                    pass
-                        
-                        if not pub_date:
-                            pub_date = datetime.now()
-                        
-                        # Categorize the release
-                        category = categorize_release(title)
-                        
-                        news_items.append({
-                            "published_at": pub_date,
-                            "source": f"Federal Reserve ({category})",
-                            "title": title,
-                            "url": href,
-                        })
-                        
-                    except Exception:
-                        continue
-                
-                # Method 2: Look for news-item divs
-                news_divs = soup.select("div.news-item, div.eventlist, .panel-body")
-                for item in news_divs:
-                    try:
-                        link_elem = item.select_one("a")
-                        if not link_elem:
-                            continue
-                        
-                        title = link_elem.get_text(strip=True)
-                        href = link_elem.get("href", "")
-                        
-                        if not title or not href or len(title) < 10:
-                            continue
-                        
-                        if not href.startswith("http"):
-                            href = f"https://www.federalreserve.gov{href}"
-                        
-                        # Extract date from surrounding text or URL
-                        pub_date = None
-                        date_text = item.get_text()
-                        date_patterns = [
-                            r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}",
-                            r"\d{1,2}/\d{1,2}/\d{4}",
-                        ]
-                        for pattern in date_patterns:
-                            match = re.search(pattern, date_text)
-                            if match:
-                                pub_date = parse_fed_date(match.group())
-                                break
-                        
-                        if not pub_date:
-                            date_match = re.search(r'(\d{4})(\d{2})(\d{2})', href)
-                            if date_match:
-                                try:
-                                    pub_date = datetime(
-                                        int(date_match.group(1)),
-                                        int(date_match.group(2)),
-                                        int(date_match.group(3))
-                                    )
-                                except ValueError:
-                                    pub_date = datetime.now()
-                        
-                        if not pub_date:
-                            pub_date = datetime.now()
-                        
-                        category = categorize_release(title)
-                        
-                        news_items.append({
-                            "published_at": pub_date,
-                            "source": f"Federal Reserve ({category})",
-                            "title": title,
-                            "url": href,
-                        })
-                        
-                    except Exception:
-                        continue
-                        
-            except Exception as e:
-                print(f"Error fetching {url}: {e}")
-                continue
-    
-    # Remove duplicates based on URL
-    seen_urls = set()
-    unique_items = []
-    for item in news_items:
-        if item["url"] not in seen_urls:
-            seen_urls.add(item["url"])
-            unique_items.append(item)
-    
-    return unique_items
+    return _dedupe_by_url(news_items)
 
 
 def parse_fed_date(date_str: str) -> Optional[datetime]:
@@ -246,157 +619,248 @@ def parse_fed_date(date_str: str) -> Optional[datetime]:
     
     date_str = date_str.strip()
     
-    formats = [
-        "%B %d, %Y",      # December 17, 2025
-        "%B %d %Y",       # December 17 2025
-        "%b %d, %Y",      # Dec 17, 2025
-        "%m/%d/%Y",       # 12/17/2025
-        "%Y-%m-%d",       # 2025-12-17
-        "%Y-%m-%dT%H:%M:%S",  # ISO format
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    
-    # Try ISO format with timezone
+    # ISO dates (2025-12-17, 2025-12-17T14:00:00Z) go through the C parser
     try:
         return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
     except ValueError:
         pass
     
+    # Otherwise only try the strptime formats whose shape matches
+    for shape, formats in _FED_DATE_SHAPES:
+        if shape.fullmatch(date_str):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
+    
     return None
 
 
+def _parse_rss_date(date_str: str) -> Optional[datetime]:
+    """Parse an RSS pubDate (e.g. Wed, 18 Dec 2024 15:00:00 GMT or -0500)."""
+    # RSS dates are RFC 822; the stdlib parser accepts every variant of it
+    # (named zones, no weekday, ...) rather than two fixed strptime layouts
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
+async def _fetch_rss_feed(client: httpx.AsyncClient, url: str) -> List[dict]:
+    """Fetch one Fed RSS feed and parse its items."""
+    news_items = []
+    
+    try:
+        root, cached = await _fetch_page(client, url, xml=True)
+        if cached is not None:
+            return cached
+        if root is None:
+            return news_items
+        
+        for index, item in enumerate(root.iter("item")):
+            if index == 30:
+                break
+            try:
+                title = item.findtext("title")
+                link = item.findtext("link")
+                date_str = item.findtext("pubDate")
+                
+                if title is None or link is None:
+                    continue
+                
+                title = title.strip()
+                link = link.strip()
+                
+                # Parse date
+                pub_date = datetime.now()
+                if date_str is not None:
+                    pub_date = _parse_rss_date(date_str.strip()) or pub_date
+                
+                category = categorize_release(title)
+                
+                news_items.append({
+                    "published_at": pub_date,
+                    "source": f"Federal Reserve ({category})",
+                    "title": title,
+                    "url": link,
+                })
+                
+            except Exception:
+                continue
+        
+        _cache_items(url, news_items)
+        
+    except Exception as e:
+        logger.warning(f"Error fetching RSS {url}: {e}")
+    
+    return news_items
+
+
 async def fetch_fed_rss_feeds() -> List[dict]:
     """
     Fetch from Federal Reserve RSS feeds if available.
     """
-    news_items = []
-    
     # Fed RSS feed URLs (these may change)
     rss_urls = [
         "https://www.federalreserve.gov/feeds/press_all.xml",
         "https://www.federalreserve.gov/feeds/press_monetary.xml",
     ]
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-    }
+    client = _get_client()
+    feeds = await asyncio.gather(*(_fetch_rss_feed(client, url) for url in rss_urls))
     
-    async with httpx.AsyncClient() as client:
-        for url in rss_urls:
+    return [item for items in feeds for item in items]
+
+
+async def fetch_fomc_calendar() -> List[dict]:
+    """
+    Fetch FOMC meeting dates and statements from current year.
+    """
+    news_items = []
+    url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
+    
+    try:
+        client = _get_client()
+        tree, cached = await _fetch_page(client, url)
+        if cached is not None:
+            return cached
+        if tree is None:
+            return news_items
+        
+        # Find all meeting rows
+        for row in _MEETING_ROWS(tree):
             try:
-                response = await client.get(url, headers=headers, timeout=30.0)
-                if response.status_code != 200:
-                    continue
-                
-                soup = BeautifulSoup(response.text, "xml")
-                items = soup.find_all("item")[:30]
-                
-                for item in items:
-                    try:
-                        title_elem = item.find("title")
-                        link_elem = item.find("link")
-                        pub_date_elem = item.find("pubDate")
-                        
-                        if not title_elem or not link_elem:
-                            continue
-                        
-                        title = title_elem.get_text(strip=True)
-                        link = link_elem.get_text(strip=True)
+                # Look for links to statements or minutes
+                links = _ALL_LINKS(row)
+                for link in links:
+                    href = link.get("href", "")
+                    text = _text(link).lower()
+                    
+                    if "statement" in text or "minutes" in text or "press conference" in text:
+                        if not href.startswith("http"):
+                            href = f"https://www.federalreserve.gov{href}"
                         
-                        # Parse date
-                        pub_date = datetime.now()
-                        if pub_date_elem:
-                            try:
-                                date_str = pub_date_elem.get_text(strip=True)
-                                # RSS format: Wed, 18 Dec 2024 15:00:00 GMT
-                                pub_date = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %Z")
-                            except ValueError:
-                                try:
-                                    pub_date = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
-                                except ValueError:
-                                    pass
+                        # Try to extract date from URL
+                        date_match = _DATE_URL_RE.search(href)
+                        if date_match:
+                            pub_date = datetime(
+                                int(date_match.group(1)),
+                                int(date_match.group(2)),
+                                int(date_match.group(3))
+                            )
+                        else:
+                            pub_date = datetime.now()
                         
-                        category = categorize_release(title)
+                        title = f"FOMC {text.title()}"
                         
                         news_items.append({
                             "published_at": pub_date,
-                            "source": f"Federal Reserve ({category})",
+                            "source": "Federal Reserve (FOMC)",
                             "title": title,
-                            "url": link,
+                            "url": href,
                         })
                         
-                    except Exception:
-                        continue
-                        
-            except Exception as e:
-                print(f"Error fetching RSS {url}: {e}")
+            except Exception:
                 continue
+        
+        _cache_items(url, news_items)
+                
+    except Exception as e:
+        logger.warning(f"Error fetching FOMC calendar: {e}")
     
     return news_items
 
 
-async def fetch_fomc_calendar() -> List[dict]:
-    """
-    Fetch FOMC meeting dates and statements from current year.
-    """
+async def _fetch_fomc_documents(client: httpx.AsyncClient, url: str, year: int) -> List[dict]:
+    """Fetch one FOMC page and collect the meeting documents it links for `year`."""
     news_items = []
-    url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-    }
+    # The same calendar page is filtered once per year
+    cache_key = (url, year)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            if response.status_code != 200:
-                return news_items
+        tree, cached = await _fetch_page(client, url, cache_key)
+        if cached is not None:
+            return cached
+        if tree is None:
+            return news_items
+        
+        year_str = str(year)
+        
+        # Find all links on the page
+        all_links = _HREF_LINKS(tree)
+        
+        for link in all_links:
+            href = link.get("href", "")
+            
+            # Filter for FOMC-related documents (cheap href checks first)
+            # Skip PDFs for now (we want HTML statements)
+            if not href or href.endswith(".pdf"):
+                continue
+            
+            text_lower = _text(link).lower()
             
-            soup = BeautifulSoup(response.text, "lxml")
+            # Match FOMC statement URLs
+            # Format: /newsevents/pressreleases/monetary20251218a.htm
+            # Or: /monetarypolicy/fomcprojtabl20251218.htm
+            is_fomc_doc = (
+                ("/monetary" in href and year_str in href)
+                or "fomcprojtabl" in href
+                or any(term in text_lower for term in _FOMC_LINK_TERMS)
+            )
             
-            # Find all meeting rows
-            for row in soup.select("div.panel, div.fomc-meeting, tr"):
+            if not is_fomc_doc:
+                continue
+            
+            # Build full URL
+            if not href.startswith("http"):
+                href = f"https://www.federalreserve.gov{href}"
+            
+            # Extract date from URL
+            date_match = _DATE_URL_RE.search(href)
+            if date_match:
                 try:
-                    # Look for links to statements or minutes
-                    links = row.select("a")
-                    for link in links:
-                        href = link.get("href", "")
-                        text = link.get_text(strip=True).lower()
-                        
-                        if "statement" in text or "minutes" in text or "press conference" in text:
-                            if not href.startswith("http"):
-                                href = f"https://www.federalreserve.gov{href}"
-                            
-                            # Try to extract date from URL
-                            date_match = re.search(r'(\d{4})(\d{2})(\d{2})', href)
-                            if date_match:
-                                pub_date = datetime(
-                                    int(date_match.group(1)),
-                                    int(date_match.group(2)),
-                                    int(date_match.group(3))
-                                )
-                            else:
-                                pub_date = datetime.now()
-                            
-                            title = f"FOMC {text.title()}"
-                            
-                            news_items.append({
-                                "published_at": pub_date,
-                                "source": "Federal Reserve (FOMC)",
-                                "title": title,
-                                "url": href,
-                            })
-                            
-                except Exception:
+                    pub_date = datetime(
+                        int(date_match.group(1)),
+                        int(date_match.group(2)),
+                        int(date_match.group(3))
+                    )
+                except ValueError:
                     continue
-                    
+            else:
+                continue
+            
+            # Determine document type
+            if "statement" in text_lower or "monetary" in href:
+                doc_type = "Statement"
+            elif "minutes" in text_lower:
+                doc_type = "Minutes"
+            elif "press conference" in text_lower or "presconf" in href:
+                doc_type = "Press Conference"
+            elif "projection" in text_lower or "projtabl" in href:
+                doc_type = "Projections"
+            elif "implementation" in text_lower:
+                doc_type = "Implementation Note"
+            else:
+                doc_type = "Document"
+            
+            # Create title
+            date_str = pub_date.strftime("%B %d, %Y")
+            title = f"FOMC {doc_type} - {date_str}"
+            
+            news_items.append({
+                "published_at": pub_date,
+                "source": "Federal Reserve (FOMC)",
+                "title": title,
+                "url": href,
+                "doc_type": doc_type,
+            })
+        
+        _cache_items(url, news_items, cache_key)
+        
     except Exception as e:
-        print(f"Error fetching FOMC calendar: {e}")
+        logger.warning(f"Error fetching {url}: {e}")
     
     return news_items
 
@@ -412,115 +876,23 @@ async def fetch_fomc_statements(years: List[int] = None) -> List[dict]:
         current_year = datetime.now().year
         years = [current_year, current_year - 1]  # Current and previous year
     
-    news_items = []
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-    }
+    # Try different URL patterns for FOMC historical data
+    pages = [
+        (url, year)
+        for year in years
+        for url in (
+            f"https://www.federalreserve.gov/monetarypolicy/fomchistorical{year}.htm",
+            "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm",
+        )
+    ]
     
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for year in years:
-            # Try different URL patterns for FOMC historical data
-            urls = [
-                f"https://www.federalreserve.gov/monetarypolicy/fomchistorical{year}.htm",
-                f"https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm",
-            ]
-            
-            for url in urls:
-                try:
-                    response = await client.get(url, headers=headers, timeout=30.0)
-                    if response.status_code != 200:
-                        continue
-                    
-                    soup = BeautifulSoup(response.text, "lxml")
-                    
-                    # Find all links on the page
-                    all_links = soup.find_all("a", href=True)
-                    
-                    for link in all_links:
-                        href = link.get("href", "")
-                        text = link.get_text(strip=True)
-                        
-                        # Filter for FOMC-related documents
-                        if not href:
-                            continue
-                        
-                        # Match FOMC statement URLs
-                        # Format: /newsevents/pressreleases/monetary20251218a.htm
-                        # Or: /monetarypolicy/fomcprojtabl20251218.htm
-                        is_fomc_doc = any([
-                            "/monetary" in href and str(year) in href,
-                            "fomcprojtabl" in href,
-                            "statement" in text.lower(),
-                            "minutes" in text.lower(),
-                            "press conference" in text.lower(),
-                            "projection" in text.lower(),
-                            "implementation note" in text.lower(),
-                        ])
-                        
-                        if not is_fomc_doc:
-                            continue
-                        
-                        # Build full URL
-                        if not href.startswith("http"):
-                            href = f"https://www.federalreserve.gov{href}"
-                        
-                        # Skip PDFs for now (we want HTML statements)
-                        if href.endswith(".pdf"):
-                            continue
-                        
-                        # Extract date from URL
-                        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', href)
-                        if date_match:
-                            try:
-                                pub_date = datetime(
-                                    int(date_match.group(1)),
-                                    int(date_match.group(2)),
-                                    int(date_match.group(3))
-                                )
-                            except ValueError:
-                                continue
-                        else:
-                            continue
-                        
-                        # Determine document type
-                        text_lower = text.lower()
-                        if "statement" in text_lower or "monetary" in href:
-                            doc_type = "Statement"
-                        elif "minutes" in text_lower:
-                            doc_type = "Minutes"
-                        elif "press conference" in text_lower or "presconf" in href:
-                            doc_type = "Press Conference"
-                        elif "projection" in text_lower or "projtabl" in href:
-                            doc_type = "Projections"
-                        elif "implementation" in text_lower:
-                            doc_type = "Implementation Note"
-                        else:
-                            doc_type = "Document"
-                        
-                        # Create title
-                        date_str = pub_date.strftime("%B %d, %Y")
-                        title = f"FOMC {doc_type} - {date_str}"
-                        
-                        news_items.append({
-                            "published_at": pub_date,
-                            "source": "Federal Reserve (FOMC)",
-                            "title": title,
-                            "url": href,
-                            "doc_type": doc_type,
-                        })
-                        
-                except Exception as e:
-                    print(f"Error fetching {url}: {e}")
-                    continue
+    client = _get_client()
+    results = await asyncio.gather(
+        *(_fetch_fomc_documents(client, url, year) for url, year in pages)
+    )
+    news_items = [item for items in results for item in items]
     
-    # Remove duplicates based on URL
-    seen_urls = set()
-    unique_items = []
-    for item in news_items:
-        if item["url"] not in seen_urls:
-            seen_urls.add(item["url"])
-            unique_items.append(item)
+    unique_items = _dedupe_by_url(news_items)
     
     # Sort by date descending
     unique_items.sort(key=lambda x: x["published_at"], reverse=True)
@@ -533,51 +905,83 @@ async def fetch_fomc_statement_content(url: str) -> Optional[str]:
     Fetch the actual content of an FOMC statement for analysis.
     Returns the text content of the statement.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-    }
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            if response.status_code != 200:
-                return None
-            
-            soup = BeautifulSoup(response.text, "lxml")
-            
-            # Find the main content area
-            content_selectors = [
-                "div.col-xs-12.col-sm-8.col-md-8",
-                "div#article",
-                "article",
-                "div.content",
-                "main",
-            ]
-            
-            for selector in content_selectors:
-                content = soup.select_one(selector)
-                if content:
-                    # Remove script and style elements
-                    for elem in content.find_all(["script", "style", "nav", "footer"]):
-                        elem.decompose()
-                    
-                    text = content.get_text(separator="\n", strip=True)
-                    if len(text) > 200:  # Ensure we got meaningful content
-                        return text
-            
-            # Fallback to body text
-            body = soup.find("body")
-            if body:
-                for elem in body.find_all(["script", "style", "nav", "footer", "header"]):
-                    elem.decompose()
-                return body.get_text(separator="\n", strip=True)
+        client = _get_client()
+        tree = await _fetch_tree(client, url)
+        if tree is None:
+            return None
+        
+        # Find the main content area
+        for selector in _CONTENT_AREAS:
+            content = _first(selector, tree)
+            if content is not None:
+                # Remove script and style elements
+                for elem in _CONTENT_NOISE(content):
+                    elem.drop_tree()
                 
+                text = _text(content, separator="\n")
+                if len(text) > 200:  # Ensure we got meaningful content
+                    return text
+        
+        # Fallback to body text
+        body = _first(_BODY, tree)
+        if body is not None:
+            for elem in _BODY_NOISE(body):
+                elem.drop_tree()
+            return _text(body, separator="\n")
+            
     except Exception as e:
-        print(f"Error fetching statement content from {url}: {e}")
+        logger.warning(f"Error fetching statement content from {url}: {e}")
     
     return None
 
 
+def _now_naive() -> datetime:
+    """Current UTC time as a naive datetime, the form published_at is stored in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _existing_urls(db: Session, urls: List[str]) -> set:
+    """Return the subset of `urls` already stored, using a single IN query."""
+    if not urls:
+        return set()
+    return {url for (url,) in db.query(NewsItem.url).filter(NewsItem.url.in_(urls))}
+
+
+def _insert_news(db: Session, rows: List[dict]) -> set:
+    """
+    Insert news rows with one multi-row INSERT ... ON CONFLICT DO NOTHING per
+    batch; the unique url index drops rows that are already stored.
+    Returns the URLs actually inserted.
+    """
+    inserted = set()
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        stmt = insert(NewsItem).values(rows[i:i + INSERT_BATCH_SIZE])
+        inserted.update(db.scalars(
+            stmt.on_conflict_do_nothing(index_elements=["url"]).returning(NewsItem.url)
+        ))
+    return inserted
+
+
+async def _classify_statements(urls: List[str]) -> List[Optional[tuple]]:
+    """
+    Fetch statement bodies (at most STATEMENT_FETCH_CONCURRENCY at a time) and
+    classify each on a worker thread as soon as it arrives, so scanning one
+    body overlaps the downloads of the others.
+    Returns the (stance, confidence) per URL, or None where no content came back.
+    """
+    semaphore = asyncio.Semaphore(STATEMENT_FETCH_CONCURRENCY)
+    
+    async def fetch_and_classify(url: str) -> Optional[tuple]:
+        async with semaphore:
+            content = await fetch_fomc_statement_content(url)
+        if not content:
+            return None
+        return await asyncio.to_thread(classify_stance, content)
+    
+    return await asyncio.gather(*(fetch_and_classify(url) for url in urls))
+
+
 async def fetch_and_store_news(db: Session, include_historical: bool = False) -> dict:
     """
     Fetch news from all Federal Reserve sources and store in database.
@@ -595,54 +999,45 @@ async def fetch_and_store_news(db: Session, include_historical: bool = False) ->
     
     all_news = []
     
-    # Fetch from multiple sources
-    try:
-        press_releases = await fetch_fed_press_releases()
-        all_news.extend(press_releases)
-        print(f"  Fetched {len(press_releases)} from press releases page")
-    except Exception as e:
-        results["errors"].append(f"Press releases: {e}")
-    
-    try:
-        rss_news = await fetch_fed_rss_feeds()
-        all_news.extend(rss_news)
-        print(f"  Fetched {len(rss_news)} from RSS feeds")
-    except Exception as e:
-        results["errors"].append(f"RSS feeds: {e}")
-    
-    try:
-        fomc_news = await fetch_fomc_calendar()
-        all_news.extend(fomc_news)
-        print(f"  Fetched {len(fomc_news)} from FOMC calendar")
-    except Exception as e:
-        results["errors"].append(f"FOMC calendar: {e}")
+    # Fetch from all sources concurrently
+    sources = [
+        ("Press releases", "from press releases page", fetch_fed_press_releases()),
+        ("RSS feeds", "from RSS feeds", fetch_fed_rss_feeds()),
+        ("FOMC calendar", "from FOMC calendar", fetch_fomc_calendar()),
+    ]
     
     # Fetch historical FOMC statements if requested
     if include_historical:
-        try:
-            current_year = datetime.now().year
-            fomc_statements = await fetch_fomc_statements(years=[current_year, current_year - 1])
-            all_news.extend(fomc_statements)
-            print(f"  Fetched {len(fomc_statements)} FOMC statements from {current_year-1}-{current_year}")
-        except Exception as e:
-            results["errors"].append(f"FOMC statements: {e}")
+        current_year = datetime.now().year
+        sources.append((
+            "FOMC statements",
+            f"FOMC statements from {current_year-1}-{current_year}",
+            fetch_fomc_statements(years=[current_year, current_year - 1]),
+        ))
+    
+    async with _client_scope():
+        fetched = await asyncio.gather(*(fetch for _, _, fetch in sources), return_exceptions=True)
+    
+    for (name, description, _), items in zip(sources, fetched):
+        if isinstance(items, Exception):
+            results["errors"].append(f"{name}: {items}")
+            continue
+        all_news.extend(items)
+        print(f"  Fetched {len(items)} {description}")
     
     # Remove duplicates
-    seen_urls = set()
-    unique_news = []
-    for item in all_news:
-        if item["url"] not in seen_urls:
-            seen_urls.add(item["url"])
-            unique_news.append(item)
+    unique_news = _dedupe_by_url(all_news)
     
     results["fetched"] = len(unique_news)
     
     # For historical mode, don't filter by date
     if include_historical:
-        cutoff = datetime.utcnow() - timedelta(days=365)  # Last year
+        cutoff = _now_naive() - timedelta(days=365)  # Last year
     else:
-        cutoff = datetime.utcnow() - timedelta(days=7)
+        cutoff = _now_naive() - timedelta(days=7)
     
+    stamp = _now_naive()
+    rows = []
     for item in unique_news:
         pub_at = item["published_at"]
         if pub_at.tzinfo is not None:
@@ -652,25 +1047,24 @@ async def fetch_and_store_news(db: Session, include_historical: bool = False) ->
         if pub_at < cutoff:
             continue
         
-        # Check if already exists
-        existing = db.query(NewsItem).filter(NewsItem.url == item["url"]).first()
-        if existing:
-            results["skipped"] += 1
-            continue
-        
         # Classify stance based on title
-        stance, confidence = classify_stance(item["title"])
+        stance, confidence = _classify_title(item["title"])
         
-        news_item = NewsItem(
-            published_at=pub_at,
-            source=item["source"],
-            title=item["title"],
-            url=item["url"],
-            stance=stance,
-            confidence=confidence,
-        )
-        db.add(news_item)
-        results["inserted"] += 1
+        rows.append({
+            "published_at": pub_at,
+            "source": item["source"],
+            "category": categorize_release(item["title"]),
+            "title": item["title"],
+            "url": item["url"],
+            "stance": stance,
+            "confidence": confidence,
+            "created_at": stamp,
+        })
+    
+    # Items already stored are skipped by the database, not checked up front
+    inserted = _insert_news(db, rows)
+    results["inserted"] = len(inserted)
+    results["skipped"] = len(rows) - len(inserted)
     
     db.commit()
     return results
@@ -697,50 +1091,70 @@ async def fetch_and_store_fomc_history(db: Session, years: List[int] = None) ->
         years = [current_year, current_year - 1]
     
     try:
-        fomc_statements = await fetch_fomc_statements(years=years)
-        results["fetched"] = len(fomc_statements)
+        # Network fetches share one client; it is closed before the DB work
+        async with _client_scope():
+            fomc_statements = await fetch_fomc_statements(years=years)
+            results["fetched"] = len(fomc_statements)
+            
+            existing_urls = _existing_urls(db, [item["url"] for item in fomc_statements])
+            
+            new_items = []
+            for item in fomc_statements:
+                # Check if already exists
+                if item["url"] in existing_urls:
+                    results["skipped"] += 1
+                    continue
+                new_items.append(item)
+            
+            # For statements, fetch and classify the full content (concurrently)
+            statement_urls = [
+                item["url"] for item in new_items
+                if item.get("doc_type", "Document") == "Statement"
+            ]
+            content_stances = dict(zip(statement_urls, await _classify_statements(statement_urls)))
         
-        for item in fomc_statements:
+        stamp = _now_naive()
+        rows = []
+        for item in new_items:
             pub_at = item["published_at"]
             if pub_at.tzinfo is not None:
                 pub_at = pub_at.replace(tzinfo=None)
             
-            # Check if already exists
-            existing = db.query(NewsItem).filter(NewsItem.url == item["url"]).first()
-            if existing:
-                results["skipped"] += 1
-                continue
-            
             # Classify stance based on title
-            stance, confidence = classify_stance(item["title"])
+            stance, confidence = _classify_title(item["title"])
             
-            # For statements, try to fetch and analyze the content
-            doc_type = item.get("doc_type", "Document")
-            if doc_type == "Statement":
-                content = await fetch_fomc_statement_content(item["url"])
-                if content:
-                    # Classify based on full content
-                    stance, confidence = classify_stance(content)
-                    # Boost confidence for full content analysis
-                    confidence = min(95, confidence + 10)
+            content_stance = content_stances.get(item["url"])
+            if content_stance:
+                # Classified based on full content
+                stance, confidence = content_stance
+                # Boost confidence for full content analysis
+                confidence = min(95, confidence + 10)
             
-            news_item = NewsItem(
-                published_at=pub_at,
-                source=item["source"],
-                title=item["title"],
-                url=item["url"],
-                stance=stance,
-                confidence=confidence,
-            )
-            db.add(news_item)
-            results["inserted"] += 1
-            results["statements"].append({
-                "date": pub_at.strftime("%Y-%m-%d"),
+            rows.append({
+                "published_at": pub_at,
+                "source": item["source"],
+                "category": categorize_release(item["title"]),
                 "title": item["title"],
+                "url": item["url"],
                 "stance": stance,
                 "confidence": confidence,
+                "created_at": stamp,
             })
         
+        # A concurrent run may have stored some of these since the check above
+        inserted = _insert_news(db, rows)
+        results["inserted"] = len(inserted)
+        results["skipped"] += len(rows) - len(inserted)
+        results["statements"] = [
+            {
+                "date": row["published_at"].strftime("%Y-%m-%d"),
+                "title": row["title"],
+                "stance": row["stance"],
+                "confidence": row["confidence"],
+            }
+            for row in rows if row["url"] in inserted
+        ]
+        
         db.commit()
         
     except Exception as e:
@@ -749,17 +1163,34 @@ async def fetch_and_store_fomc_history(db: Session, years: List[int] = None) ->
     return results
 
 
-def get_recent_news(db: Session, hours: int = 48) -> List[NewsItem]:
-    """Get news items from the last N hours."""
-    cutoff = datetime.utcnow() - timedelta(hours=hours)
-    return db.query(NewsItem).filter(
+# What the prompt readers show per item; the (potentially long) summary
+# text isn't loaded
+_NEWS_ROW_COLUMNS = (
+    NewsItem.id,
+    NewsItem.published_at,
+    NewsItem.source,
+    NewsItem.title,
+    NewsItem.url,
+    NewsItem.stance,
+    NewsItem.confidence,
+)
+
+
+def get_recent_news(db: Session, hours: int = 48, limit: Optional[int] = None) -> list:
+    """
+    Get news items from the last N hours (newest first, at most `limit`).
+    Returns lightweight rows exposing id, published_at, source, title, url,
+    stance and confidence.
+    """
+    cutoff = _now_naive() - timedelta(hours=hours)
+    return db.execute(select(*_NEWS_ROW_COLUMNS).filter(
         NewsItem.published_at >= cutoff
-    ).order_by(NewsItem.published_at.desc()).all()
+    ).order_by(NewsItem.published_at.desc()).limit(limit)).all()
 
 
 def get_all_recent_news(db: Session, days: int = 7) -> List[NewsItem]:
     """Get all news items from the last N days."""
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff = _now_naive() - timedelta(days=days)
     return db.query(NewsItem).filter(
         NewsItem.published_at >= cutoff
     ).order_by(NewsItem.published_at.desc()).all()
@@ -767,17 +1198,20 @@ def get_all_recent_news(db: Session, days: int = 7) -> List[NewsItem]:
 
 def get_top_drivers(db: Session, limit: int = 3) -> List[NewsItem]:
     """Get top news drivers by confidence score."""
-    cutoff = datetime.utcnow() - timedelta(hours=48)
+    cutoff = _now_naive() - timedelta(hours=48)
     return db.query(NewsItem).filter(
         NewsItem.published_at >= cutoff,
         NewsItem.confidence.isnot(None)
     ).order_by(NewsItem.confidence.desc()).limit(limit).all()
 
 
-def get_fomc_related_news(db: Session, days: int = 7) -> List[NewsItem]:
-    """Get FOMC-specific news items."""
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    return db.query(NewsItem).filter(
+def get_fomc_related_news(db: Session, days: int = 7, limit: Optional[int] = None) -> list:
+    """
+    Get FOMC-specific news items (newest first, at most `limit`), as the
+    same lightweight rows as get_recent_news.
+    """
+    cutoff = _now_naive() - timedelta(days=days)
+    return db.execute(select(*_NEWS_ROW_COLUMNS).filter(
+        NewsItem.category == "FOMC",
         NewsItem.published_at >= cutoff,
-        NewsItem.source.contains("FOMC")
-    ).order_by(NewsItem.published_at.desc()).all()
+    ).order_by(NewsItem.published_at.desc()).limit(limit)).all()
@@ -1,6 +1,9 @@
 """Prompt generator - creates analysis prompts for Cursor."""
 
+import os
+import uuid
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -8,9 +11,321 @@ from sqlalchemy.orm import Session
 
 from app.models import Snapshot, EconomicEvent, NewsItem
 from app.config import PROMPTS_DIR, SYMBOLS, TIMEFRAMES, SCREENSHOTS_DIR
-from app.agents.snapshot_collector import get_snapshots_for_date
+from app.agents.snapshot_collector import get_snapshots_indexed
 from app.agents.fundamental import get_todays_events, get_danger_windows
-from app.agents.news_collector import get_recent_news, get_fomc_related_news, get_all_recent_news
+
+
+# Screenshot paths in the prompt are absolute; joined as plain strings per cell
+_SCREENSHOTS_PREFIX = os.path.join(str(SCREENSHOTS_DIR), "")
+
+# Marker shown next to each news/FOMC item; unknown stances read as neutral
+_STANCE_EMOJI = {"hawkish": "🔴", "dovish": "🟢", "neutral": "⚪"}
+
+
+# Static prompt sections, built once at import. Each is appended to the
+# prompt as a single entry; multi-line blocks end with "\n" where the
+# section is followed by a blank line.
+_INSTRUCTIONS_MD = """\
+## Instructions
+
+Please analyze the attached TradingView screenshots using ICT concepts and the Turtle Soup pattern.
+Provide your analysis in the JSON format specified at the end of this document.
+"""
+
+_FRAMEWORK_MD = """\
+## Analysis Framework
+
+### ICT Concepts to Identify
+- **Liquidity Sweeps**: Look for stops taken above/below recent highs/lows
+- **Market Structure Shift (MSS)**: Break of structure indicating potential reversal
+- **Fair Value Gaps (FVG)**: Imbalanced price action leaving gaps
+- **Order Blocks (OB)**: Last candle before impulsive move
+- **Premium/Discount**: Where is price relative to range?
+
+### Turtle Soup Pattern
+Look for:
+1. Price breaks above/below a significant level (fake breakout)
+2. Quick rejection back into range
+3. Entry on the reversal, stop beyond the fake breakout
+
+### Key Levels to Identify
+- Previous Day High (PDH) / Previous Day Low (PDL)
+- Previous Week High (PWH) / Previous Week Low (PWL)
+- Session highs/lows (Asian, London, NY)
+"""
+
+_SYMBOL_FRAMEWORK_MD = """\
+## Analysis Framework
+
+### ICT Concepts
+- Liquidity Sweeps (stops taken above/below highs/lows)
+- Market Structure Shift (MSS)
+- Fair Value Gaps (FVG) & Order Blocks (OB)
+- Premium/Discount zones
+
+### Turtle Soup Pattern
+- Fake breakout → quick rejection → reversal entry
+"""
+
+_OUTPUT_FORMAT_MD = """\
+## Required Output Format
+
+Please respond with ONLY valid JSON in this exact structure:
+
+```json"""
+
+# Closes the ```json fence opened by _OUTPUT_FORMAT_MD
+_DAILY_JSON_EXAMPLE = """{
+  "signals": {
+    "XAUUSD": {
+      "bias": "bullish | bearish | neutral",
+      "confidence": 75,
+      "levels": {
+        "pdh": 2650.00,
+        "pdl": 2620.00,
+        "pwh": 2680.00,
+        "pwl": 2580.00,
+        "key_support": 2615.00,
+        "key_resistance": 2660.00
+      },
+      "ict_notes": "Markdown notes about ICT analysis...",
+      "turtle_soup": {
+        "detected": true,
+        "direction": "long",
+        "entry": 2625.00,
+        "invalidation": 2615.00,
+        "tp1": 2650.00,
+        "tp2": 2680.00,
+        "description": "Sweep of PDL followed by MSS..."
+      },
+      "trade_plan": {
+        "direction": "long | short | no_trade",
+        "entry_zone": {"low": 2620.00, "high": 2630.00},
+        "invalidation": 2610.00,
+        "tp1": 2650.00,
+        "tp2": 2680.00,
+        "stand_down_if": ["NFP in next 2 hours", "Price above 2665"]
+      }
+    },
+    "EURUSD": {
+      "bias": "bearish | bullish | neutral",
+      "confidence": 60,
+      "levels": { ... },
+      "ict_notes": "...",
+      "turtle_soup": { ... },
+      "trade_plan": { ... }
+    }
+  },
+  "market_context": "Brief overall market sentiment summary",
+  "news_impact": "How the news/calendar affects bias"
+}
+```"""
+
+# Per-symbol variant; "%s" takes the symbol. Also closes the ```json fence
+_SYMBOL_JSON_TEMPLATE = """{
+  "symbol": "%s",
+  "bias": "bullish | bearish | neutral",
+  "confidence": 75,
+  "levels": {
+    "pdh": 0.00,
+    "pdl": 0.00,
+    "pwh": 0.00,
+    "pwl": 0.00,
+    "key_support": 0.00,
+    "key_resistance": 0.00
+  },
+  "ict_notes": "Markdown notes about ICT analysis...",
+  "turtle_soup": {
+    "detected": true,
+    "direction": "long | short | none",
+    "entry": 0.00,
+    "invalidation": 0.00,
+    "tp1": 0.00,
+    "tp2": 0.00,
+    "description": "Description of the setup..."
+  },
+  "trade_plan": {
+    "direction": "long | short | no_trade",
+    "entry_zone": {"low": 0.00, "high": 0.00},
+    "invalidation": 0.00,
+    "tp1": 0.00,
+    "tp2": 0.00,
+    "stand_down_if": ["condition1", "condition2"]
+  },
+  "market_context": "Brief market sentiment"
+}
+```"""
+
+
+@lru_cache(maxsize=32)
+def _symbol_json_example(symbol: str) -> str:
+    """JSON output example for one symbol; only a handful are ever rendered."""
+    return _SYMBOL_JSON_TEMPLATE % symbol
+
+
+def _hhmm(dt: datetime) -> str:
+    """Format a time as HH:MM with integer formatting rather than strftime."""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def _write_prompt(prompt_path: Path, prompt_content: str):
+    """
+    Write a prompt file as UTF-8 in a single write call, atomically: the
+    content lands in a temp file beside it that is then renamed over the
+    target, so readers never see a half-written prompt.
+    """
+    tmp_path = prompt_path.with_name(f".{prompt_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        # Encoding up front skips the text layer's chunked encode-and-flush
+        # loop; UTF-8 regardless of locale, since the prompts contain emoji
+        with open(tmp_path, "wb") as f:
+            f.write(prompt_content.encode("utf-8"))
+        os.replace(tmp_path, prompt_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _high_impact_rows(high_impact: list) -> str:
+    """Body of the high-impact events table, one row per event."""
+    return "\n".join(
+        f"| {_hhmm(e.event_time_utc)} | {e.currency} | {e.title} | {e.forecast or '-'} | {e.previous or '-'} |"
+        for e in high_impact
+    )
+
+
+# Each _emit_* helper appends one context section of the daily prompt and
+# returns whether it did; sections with no source data are left out.
+
+def _emit_calendar(lines: List[str], events: list) -> bool:
+    """Today's USD/EUR calendar: high-impact table, then the other events."""
+    if not events:
+        return False
+    
+    lines.append("## Today's Economic Calendar (USD/EUR)")
+    lines.append("")
+    
+    # High impact first; split both tables in one pass over the events
+    high_impact, other_events = [], []
+    for event in events:
+        (high_impact if event.impact == "high" else other_events).append(event)
+    
+    if high_impact:
+        lines.append("### High Impact Events ⚠️")
+        lines.append("")
+        lines.append("| Time (UTC) | Currency | Event | Forecast | Previous |")
+        lines.append("|------------|----------|-------|----------|----------|")
+        lines.append(_high_impact_rows(high_impact))
+        lines.append("")
+    
+    if other_events:
+        lines.append("### Other Events")
+        lines.append("")
+        lines.append("| Time (UTC) | Currency | Impact | Event |")
+        lines.append("|------------|----------|--------|-------|")
+        lines.append("\n".join(
+            f"| {_hhmm(e.event_time_utc)} | {e.currency} | {e.impact} | {e.title} |"
+            for e in other_events
+        ))
+        lines.append("")
+    
+    return True
+
+
+def _emit_danger(lines: List[str], danger_windows: List[dict]) -> bool:
+    """Danger windows around today's high-impact events."""
+    if not danger_windows:
+        return False
+    
+    lines.append("### Danger Windows (±30 min around high-impact events)")
+    lines.append("")
+    for window in danger_windows:
+        start = _hhmm(window["start"])
+        end = _hhmm(window["end"])
+        lines.append(f"- {start} - {end} UTC: {window['event'].title}")
+    lines.append("")
+    return True
+
+
+def _emit_fomc(lines: List[str], fomc_news: list) -> bool:
+    """Table of recent FOMC documents with their stance."""
+    if not fomc_news:
+        return False
+    
+    lines.append("## Recent FOMC Statements & Meetings")
+    lines.append("")
+    lines.append("| Date | Document | Stance |")
+    lines.append("|------|----------|--------|")
+    # Dedupe by date+title combo, keeping the first
+    unique_items = {}
+    for item in fomc_news:
+        unique_items.setdefault((item.published_at.date(), item.title[:30]), item)
+    lines.append("\n".join(
+        f"| {item.published_at.date().isoformat()} | [{item.title}]({item.url}) | "
+        f"{_STANCE_EMOJI.get(item.stance, '⚪')} {item.stance or 'neutral'} ({item.confidence or 0}%) |"
+        for item in unique_items.values()
+    ))
+    lines.append("")
+    return True
+
+
+def _emit_news(lines: List[str], news: list) -> bool:
+    """Fed news from the last 48 hours."""
+    if not news:
+        return False
+    
+    lines.append("## Recent Fed News (Last 48h)")
+    lines.append("")
+    for item in news:
+        stance_emoji = _STANCE_EMOJI.get(item.stance, "⚪")
+        lines.append(f"- {stance_emoji} [{item.title}]({item.url}) - {item.source}")
+    lines.append("")
+    return True
+
+
+def _render_symbol_context(db: Session, target_date: date) -> str:
+    """Render the calendar, danger-window and FOMC context block of a symbol prompt."""
+    # news_collector (HTTP client, parsers, compiled patterns) only loads
+    # when a prompt actually needs news
+    from app.agents.news_collector import get_fomc_related_news
+    
+    lines = []
+    # Economic calendar section
+    events = get_todays_events(db, currencies=["USD", "EUR"], target_date=target_date)
+    danger_windows = get_danger_windows(db, target_date)
+    
+    lines.append("## Today's Economic Calendar (USD/EUR)")
+    lines.append("")
+    
+    if events:
+        high_impact = [e for e in events if e.impact == "high"]
+        
+        if high_impact:
+            lines.append("### High Impact Events ⚠️")
+            lines.append("")
+            lines.append("| Time (UTC) | Currency | Event | Forecast | Previous |")
+            lines.append("|------------|----------|-------|----------|----------|")
+            lines.append(_high_impact_rows(high_impact))
+            lines.append("")
+    else:
+        lines.append("No high-impact USD/EUR events scheduled for today.")
+        lines.append("")
+    
+    # Danger windows
+    _emit_danger(lines, danger_windows)
+    
+    # Recent FOMC
+    fomc_news = get_fomc_related_news(db, days=60, limit=5)
+    if fomc_news:
+        lines.append("## Recent FOMC Context")
+        lines.append("")
+        for item in fomc_news:  # Top 5 only
+            stance_emoji = _STANCE_EMOJI.get(item.stance, "⚪")
+            date_str = item.published_at.date().isoformat()
+            lines.append(f"- {stance_emoji} {date_str}: {item.title}")
+        lines.append("")
+    
+    return "\n".join(lines)
 
 
 def generate_symbol_prompt(
@@ -32,15 +347,9 @@ def generate_symbol_prompt(
     if target_date is None:
         target_date = date.today()
     
-    # Collect data
-    snapshots = get_snapshots_for_date(db, target_date)
-    
-    # Filter snapshots for this symbol only
-    symbol_snapshots = {
-        snap.timeframe: snap 
-        for snap in snapshots 
-        if snap.symbol.upper() == symbol.upper()
-    }
+    # Collect this symbol's snapshots, keyed by timeframe
+    symbol_key = symbol.upper()
+    symbol_snapshots = get_snapshots_indexed(db, target_date, [symbol_key])[symbol_key]
     
     # Build the prompt
     lines = []
@@ -63,110 +372,20 @@ def generate_symbol_prompt(
         for tf in TIMEFRAMES:
             if tf in symbol_snapshots:
                 snap = symbol_snapshots[tf]
-                abs_path = SCREENSHOTS_DIR / Path(snap.file_path).name
+                abs_path = _SCREENSHOTS_PREFIX + os.path.basename(snap.file_path)
                 lines.append(f"- {tf}: `{abs_path}`")
             else:
                 lines.append(f"- {tf}: **Missing**")
     lines.append("")
     
-    # Only include context for first symbol to save space
+    # Calendar/news context (only the first symbol's prompt carries it, to save space)
     if include_context:
-        # Economic calendar section
-        events = get_todays_events(db, currencies=["USD", "EUR"])
-        danger_windows = get_danger_windows(db, target_date)
-        
-        lines.append("## Today's Economic Calendar (USD/EUR)")
-        lines.append("")
-        
-        if events:
-            high_impact = [e for e in events if e.impact == "high"]
-            
-            if high_impact:
-                lines.append("### High Impact Events ⚠️")
-                lines.append("")
-                lines.append("| Time (UTC) | Currency | Event | Forecast | Previous |")
-                lines.append("|------------|----------|-------|----------|----------|")
-                for event in high_impact:
-                    time_str = event.event_time_utc.strftime("%H:%M")
-                    lines.append(f"| {time_str} | {event.currency} | {event.title} | {event.forecast or '-'} | {event.previous or '-'} |")
-                lines.append("")
-        else:
-            lines.append("No high-impact USD/EUR events scheduled for today.")
-            lines.append("")
-        
-        # Danger windows
-        if danger_windows:
-            lines.append("### Danger Windows (±30 min around high-impact events)")
-            lines.append("")
-            for window in danger_windows:
-                start = window["start"].strftime("%H:%M")
-                end = window["end"].strftime("%H:%M")
-                lines.append(f"- {start} - {end} UTC: {window['event'].title}")
-            lines.append("")
-        
-        # Recent FOMC
-        fomc_news = get_fomc_related_news(db, days=60)
-        if fomc_news:
-            lines.append("## Recent FOMC Context")
-            lines.append("")
-            for item in fomc_news[:5]:  # Top 5 only
-                stance_emoji = {"hawkish": "🔴", "dovish": "🟢", "neutral": "⚪"}.get(item.stance, "⚪")
-                date_str = item.published_at.strftime("%Y-%m-%d")
-                lines.append(f"- {stance_emoji} {date_str}: {item.title}")
-            lines.append("")
-    
-    # Analysis framework (condensed)
-    lines.append("## Analysis Framework")
-    lines.append("")
-    lines.append("### ICT Concepts")
-    lines.append("- Liquidity Sweeps (stops taken above/below highs/lows)")
-    lines.append("- Market Structure Shift (MSS)")
-    lines.append("- Fair Value Gaps (FVG) & Order Blocks (OB)")
-    lines.append("- Premium/Discount zones")
-    lines.append("")
-    lines.append("### Turtle Soup Pattern")
-    lines.append("- Fake breakout → quick rejection → reversal entry")
-    lines.append("")
+        lines.append(_render_symbol_context(db, target_date))
     
-    # Output format (single symbol)
-    lines.append("## Required Output Format")
-    lines.append("")
-    lines.append("Please respond with ONLY valid JSON in this exact structure:")
-    lines.append("")
-    lines.append("```json")
-    lines.append(f"""{{
-  "symbol": "{symbol}",
-  "bias": "bullish | bearish | neutral",
-  "confidence": 75,
-  "levels": {{
-    "pdh": 0.00,
-    "pdl": 0.00,
-    "pwh": 0.00,
-    "pwl": 0.00,
-    "key_support": 0.00,
-    "key_resistance": 0.00
-  }},
-  "ict_notes": "Markdown notes about ICT analysis...",
-  "turtle_soup": {{
-    "detected": true,
-    "direction": "long | short | none",
-    "entry": 0.00,
-    "invalidation": 0.00,
-    "tp1": 0.00,
-    "tp2": 0.00,
-    "description": "Description of the setup..."
-  }},
-  "trade_plan": {{
-    "direction": "long | short | no_trade",
-    "entry_zone": {{"low": 0.00, "high": 0.00}},
-    "invalidation": 0.00,
-    "tp1": 0.00,
-    "tp2": 0.00,
-    "stand_down_if": ["condition1", "condition2"]
-  }},
-  "market_context": "Brief market sentiment"
-}}""")
-    lines.append("```")
+    # Analysis framework (condensed) and output format (single symbol)
+    lines.append(_SYMBOL_FRAMEWORK_MD)
+    lines.append(_OUTPUT_FORMAT_MD)
+    lines.append(_symbol_json_example(symbol))
     lines.append("")
     lines.append("---")
     lines.append(f"*Generated at {datetime.now().isoformat()}*")
@@ -174,9 +393,7 @@ def generate_symbol_prompt(
     # Write to file
     prompt_content = "\n".join(lines)
     prompt_path = PROMPTS_DIR / f"{target_date.isoformat()}_{symbol}_analysis.md"
-    
-    with open(prompt_path, "w") as f:
-        f.write(prompt_content)
+    _write_prompt(prompt_path, prompt_content)
     
     return str(prompt_path)
 
@@ -189,27 +406,20 @@ def generate_prompt(db: Session, target_date: date = None) -> str:
     if target_date is None:
         target_date = date.today()
     
+    from app.agents.news_collector import get_recent_news, get_fomc_related_news
+    
     # Collect all data
-    snapshots = get_snapshots_for_date(db, target_date)
-    events = get_todays_events(db, currencies=["USD", "EUR"])
+    # Snapshots come back organized by symbol and timeframe
+    snapshots_by_symbol = get_snapshots_indexed(db, target_date, SYMBOLS)
+    events = get_todays_events(db, currencies=["USD", "EUR"], target_date=target_date)
     danger_windows = get_danger_windows(db, target_date)
-    news = get_recent_news(db, hours=48)
-    
-    # Organize snapshots by symbol and timeframe
-    snapshots_by_symbol = {symbol: {} for symbol in SYMBOLS}
-    for snap in snapshots:
-        if snap.symbol in snapshots_by_symbol:
-            snapshots_by_symbol[snap.symbol][snap.timeframe] = snap
+    news = get_recent_news(db, hours=48, limit=10)
     
     # Build the prompt
     lines = []
     lines.append(f"# Daily Analysis Request - {target_date.isoformat()}")
     lines.append("")
-    lines.append("## Instructions")
-    lines.append("")
-    lines.append("Please analyze the attached TradingView screenshots using ICT concepts and the Turtle Soup pattern.")
-    lines.append("Provide your analysis in the JSON format specified at the end of this document.")
-    lines.append("")
+    lines.append(_INSTRUCTIONS_MD)
     
     # Screenshots section
     lines.append("## Screenshots to Analyze")
@@ -226,159 +436,31 @@ def generate_prompt(db: Session, target_date: date = None) -> str:
                 if tf in symbol_snaps:
                     snap = symbol_snaps[tf]
                     # Get absolute path for Cursor
-                    abs_path = SCREENSHOTS_DIR / Path(snap.file_path).name
+                    abs_path = _SCREENSHOTS_PREFIX + os.path.basename(snap.file_path)
                     lines.append(f"- {tf}: `{abs_path}`")
                 else:
                     lines.append(f"- {tf}: **Missing**")
         lines.append("")
     
-    # Economic calendar section
-    lines.append("## Today's Economic Calendar (USD/EUR)")
-    lines.append("")
-    
-    if events:
-        # High impact first
-        high_impact = [e for e in events if e.impact == "high"]
-        other_events = [e for e in events if e.impact != "high"]
-        
-        if high_impact:
-            lines.append("### High Impact Events ⚠️")
-            lines.append("")
-            lines.append("| Time (UTC) | Currency | Event | Forecast | Previous |")
-            lines.append("|------------|----------|-------|----------|----------|")
-            for event in high_impact:
-                time_str = event.event_time_utc.strftime("%H:%M")
-                lines.append(f"| {time_str} | {event.currency} | {event.title} | {event.forecast or '-'} | {event.previous or '-'} |")
-            lines.append("")
-        
-        if other_events:
-            lines.append("### Other Events")
-            lines.append("")
-            lines.append("| Time (UTC) | Currency | Impact | Event |")
-            lines.append("|------------|----------|--------|-------|")
-            for event in other_events:
-                time_str = event.event_time_utc.strftime("%H:%M")
-                lines.append(f"| {time_str} | {event.currency} | {event.impact} | {event.title} |")
-            lines.append("")
-    else:
-        lines.append("No USD/EUR events scheduled for today.")
-        lines.append("")
-    
-    # Danger windows
-    if danger_windows:
-        lines.append("### Danger Windows (±30 min around high-impact events)")
-        lines.append("")
-        for window in danger_windows:
-            start = window["start"].strftime("%H:%M")
-            end = window["end"].strftime("%H:%M")
-            lines.append(f"- {start} - {end} UTC: {window['event'].title}")
-        lines.append("")
-    
-    # FOMC Statements section (recent meetings)
-    fomc_news = get_fomc_related_news(db, days=60)  # Last 2 months of FOMC
-    if fomc_news:
-        lines.append("## Recent FOMC Statements & Meetings")
-        lines.append("")
-        lines.append("| Date | Document | Stance |")
-        lines.append("|------|----------|--------|")
-        seen_dates = set()
-        for item in fomc_news[:15]:  # Last 15 FOMC items
-            date_str = item.published_at.strftime("%Y-%m-%d")
-            # Dedupe by date+title combo
-            key = f"{date_str}-{item.title[:30]}"
-            if key in seen_dates:
-                continue
-            seen_dates.add(key)
-            stance_emoji = {"hawkish": "🔴", "dovish": "🟢", "neutral": "⚪"}.get(item.stance, "⚪")
-            lines.append(f"| {date_str} | [{item.title}]({item.url}) | {stance_emoji} {item.stance or 'neutral'} ({item.confidence or 0}%) |")
-        lines.append("")
-    
-    # Recent news section
-    lines.append("## Recent Fed News (Last 48h)")
-    lines.append("")
-    
-    if news:
-        for item in news[:10]:  # Top 10
-            stance_emoji = {"hawkish": "🔴", "dovish": "🟢", "neutral": "⚪"}.get(item.stance, "⚪")
-            lines.append(f"- {stance_emoji} [{item.title}]({item.url}) - {item.source}")
+    # Context sections (calendar, danger windows, FOMC, news); empty ones
+    # are skipped, with a single note when there is no context at all
+    fomc_news = get_fomc_related_news(db, days=60, limit=15)  # Last 15 FOMC items, 2 months back
+    emitted = [
+        _emit_calendar(lines, events),
+        _emit_danger(lines, danger_windows),
+        _emit_fomc(lines, fomc_news),
+        _emit_news(lines, news),
+    ]
+    if not any(emitted):
+        lines.append("## Market Context")
         lines.append("")
-    else:
-        lines.append("No recent Fed-related news found.")
+        lines.append("No USD/EUR events scheduled for today and no recent Fed-related news found.")
         lines.append("")
     
-    # Analysis framework
-    lines.append("## Analysis Framework")
-    lines.append("")
-    lines.append("### ICT Concepts to Identify")
-    lines.append("- **Liquidity Sweeps**: Look for stops taken above/below recent highs/lows")
-    lines.append("- **Market Structure Shift (MSS)**: Break of structure indicating potential reversal")
-    lines.append("- **Fair Value Gaps (FVG)**: Imbalanced price action leaving gaps")
-    lines.append("- **Order Blocks (OB)**: Last candle before impulsive move")
-    lines.append("- **Premium/Discount**: Where is price relative to range?")
-    lines.append("")
-    lines.append("### Turtle Soup Pattern")
-    lines.append("Look for:")
-    lines.append("1. Price breaks above/below a significant level (fake breakout)")
-    lines.append("2. Quick rejection back into range")
-    lines.append("3. Entry on the reversal, stop beyond the fake breakout")
-    lines.append("")
-    lines.append("### Key Levels to Identify")
-    lines.append("- Previous Day High (PDH) / Previous Day Low (PDL)")
-    lines.append("- Previous Week High (PWH) / Previous Week Low (PWL)")
-    lines.append("- Session highs/lows (Asian, London, NY)")
-    lines.append("")
-    
-    # Output format
-    lines.append("## Required Output Format")
-    lines.append("")
-    lines.append("Please respond with ONLY valid JSON in this exact structure:")
-    lines.append("")
-    lines.append("```json")
-    lines.append("""{
-  "signals": {
-    "XAUUSD": {
-      "bias": "bullish | bearish | neutral",
-      "confidence": 75,
-      "levels": {
-        "pdh": 2650.00,
-        "pdl": 2620.00,
-        "pwh": 2680.00,
-        "pwl": 2580.00,
-        "key_support": 2615.00,
-        "key_resistance": 2660.00
-      },
-      "ict_notes": "Markdown notes about ICT analysis...",
-      "turtle_soup": {
-        "detected": true,
-        "direction": "long",
-        "entry": 2625.00,
-        "invalidation": 2615.00,
-        "tp1": 2650.00,
-        "tp2": 2680.00,
-        "description": "Sweep of PDL followed by MSS..."
-      },
-      "trade_plan": {
-        "direction": "long | short | no_trade",
-        "entry_zone": {"low": 2620.00, "high": 2630.00},
-        "invalidation": 2610.00,
-        "tp1": 2650.00,
-        "tp2": 2680.00,
-        "stand_down_if": ["NFP in next 2 hours", "Price above 2665"]
-      }
-    },
-    "EURUSD": {
-      "bias": "bearish | bullish | neutral",
-      "confidence": 60,
-      "levels": { ... },
-      "ict_notes": "...",
-      "turtle_soup": { ... },
-      "trade_plan": { ... }
-    }
-  },
-  "market_context": "Brief overall market sentiment summary",
-  "news_impact": "How the news/calendar affects bias"
-}
-```""")
+    # Analysis framework and output format
+    lines.append(_FRAMEWORK_MD)
+    lines.append(_OUTPUT_FORMAT_MD)
+    lines.append(_DAILY_JSON_EXAMPLE)
     lines.append("")
     lines.append("---")
     lines.append(f"*Generated at {datetime.now().isoformat()}*")
@@ -386,8 +468,6 @@ def generate_prompt(db: Session, target_date: date = None) -> str:
     # Write to file
     prompt_content = "\n".join(lines)
     prompt_path = PROMPTS_DIR / f"{target_date.isoformat()}_analysis.md"
-    
-    with open(prompt_path, "w") as f:
-        f.write(prompt_content)
+    _write_prompt(prompt_path, prompt_content)
     
     return str(prompt_path)
@@ -1,9 +1,11 @@
 """Report composer - generates final trade plans from all data."""
 
-import json
 from datetime import date, datetime
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
+import orjson
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
 from app.models import DailyReport, TASignal, Snapshot, EconomicEvent, NewsItem
@@ -12,39 +14,92 @@ from app.agents.fundamental import get_danger_windows
 from app.agents.news_collector import get_top_drivers
 
 
-def compose_report(db: Session, target_date: date, symbol: str) -> Optional[DailyReport]:
+# Timeframes a report's primary screenshot may come from
+_PRIMARY_TIMEFRAMES = ("1H", "4H", "1D")
+
+# Per-symbol lookups, built as lambda statements so their construction and
+# compilation are cached across symbols and calls
+_AGGREGATE_SIGNAL = lambda_stmt(lambda: select(TASignal).where(
+    TASignal.date == bindparam("target_date"),
+    TASignal.symbol == bindparam("symbol"),
+    TASignal.timeframe.is_(None),  # Aggregate signal
+))
+_SNAPSHOTS_BETWEEN = lambda_stmt(lambda: select(Snapshot.id, Snapshot.timeframe).where(
+    Snapshot.symbol == bindparam("symbol"),
+    Snapshot.captured_at >= bindparam("start"),
+    Snapshot.captured_at <= bindparam("end"),
+))
+
+
+def compose_reports_for_date(
+    db: Session,
+    target_date: date,
+    symbols: Iterable[str],
+    commit: bool = True
+) -> Dict[str, Optional[DailyReport]]:
+    """
+    Compose daily reports for several symbols. The danger windows and top
+    news are the same for every symbol, so they are fetched once and shared.
+    All reports are committed together (pass commit=False to leave that to
+    the caller's transaction).
+    
+    Returns {symbol: DailyReport or None}.
+    """
+    danger_windows = get_danger_windows(db, target_date)
+    top_news = get_top_drivers(db, limit=3)
+    
+    reports = {
+        symbol: compose_report(db, target_date, symbol, danger_windows, top_news, commit=False)
+        for symbol in symbols
+    }
+    if commit:
+        db.commit()
+    return reports
+
+
+def compose_report(
+    db: Session,
+    target_date: date,
+    symbol: str,
+    danger_windows: Optional[List[dict]] = None,
+    top_news: Optional[list] = None,
+    commit: bool = True
+) -> Optional[DailyReport]:
     """
     Compose a daily report for a symbol by combining TA signals,
     calendar events, and news.
     
+    danger_windows and top_news are fetched when not supplied
+    (compose_reports_for_date passes them in for a batch). With
+    commit=False the report is left in the caller's open transaction.
+    
     Returns the created DailyReport or None if insufficient data.
     """
     # Get TA signal for this symbol/date
-    ta_signal = db.query(TASignal).filter(
-        TASignal.date == target_date,
-        TASignal.symbol == symbol,
-        TASignal.timeframe.is_(None)  # Aggregate signal
-    ).first()
+    ta_signal = db.scalars(_AGGREGATE_SIGNAL, {"target_date": target_date, "symbol": symbol}).first()
     
     if not ta_signal:
         return None
     
     # Get danger windows
-    danger_windows = get_danger_windows(db, target_date)
+    if danger_windows is None:
+        danger_windows = get_danger_windows(db, target_date)
     
     # Get top news drivers
-    top_news = get_top_drivers(db, limit=3)
+    if top_news is None:
+        top_news = get_top_drivers(db, limit=3)
     
-    # Get primary screenshot (prefer 1H or 4H)
+    # Today's snapshots (id and timeframe only), read once for both the
+    # primary screenshot and the missing-timeframe check
     today_start = datetime.combine(target_date, datetime.min.time())
     today_end = datetime.combine(target_date, datetime.max.time())
     
-    primary_snapshot = db.query(Snapshot).filter(
-        Snapshot.symbol == symbol,
-        Snapshot.captured_at >= today_start,
-        Snapshot.captured_at <= today_end,
-        Snapshot.timeframe.in_(["1H", "4H", "1D"])
-    ).first()
+    snapshots = db.execute(
+        _SNAPSHOTS_BETWEEN, {"symbol": symbol, "start": today_start, "end": today_end}
+    ).all()
+    
+    # Primary screenshot (prefer 1H or 4H)
+    primary_snapshot = next((s for s in snapshots if s.timeframe in _PRIMARY_TIMEFRAMES), None)
     
     # Parse data
     turtle_soup = ta_signal.turtle_soup_json or {}
@@ -112,29 +167,24 @@ def compose_report(db: Session, target_date: date, symbol: str) -> Optional[Dail
                 f"Strong bearish bias ({ta_signal.confidence}% confidence)"
             )
     
-    # Add danger window conditions
-    for window in danger_windows:
-        event = window["event"]
-        start_str = window["start"].strftime("%H:%M")
-        end_str = window["end"].strftime("%H:%M")
-        report_data["stand_down_conditions"].append(
-            f"High-impact event: {event.title} ({event.currency}) - avoid trading {start_str}-{end_str} UTC"
-        )
+    # Add danger window conditions (as a new list, so a stand_down_if list
+    # taken from the trade plan isn't modified in place)
+    report_data["stand_down_conditions"] = [
+        *report_data["stand_down_conditions"],
+        *(
+            f"High-impact event: {w['event'].title} ({w['event'].currency}) - "
+            f"avoid trading {w['start']:%H:%M}-{w['end']:%H:%M} UTC"
+            for w in danger_windows
+        ),
+    ]
     
     # Add news context
-    for item in top_news:
-        stance_text = item.stance or "neutral"
-        report_data["supporting_evidence"].append(
-            f"News ({stance_text}): {item.title[:80]}..."
-        )
+    report_data["supporting_evidence"].extend(
+        f"News ({item.stance or 'neutral'}): {item.title[:80]}..."
+        for item in top_news
+    )
     
     # Check for missing data
-    snapshots = db.query(Snapshot).filter(
-        Snapshot.symbol == symbol,
-        Snapshot.captured_at >= today_start,
-        Snapshot.captured_at <= today_end
-    ).all()
-    
     timeframes_found = {s.timeframe for s in snapshots}
     required_tfs = {"1W", "1D", "4H", "1H"}
     missing_tfs = required_tfs - timeframes_found
@@ -142,21 +192,25 @@ def compose_report(db: Session, target_date: date, symbol: str) -> Optional[Dail
         report_data["missing_data"].append(f"Missing timeframes: {', '.join(sorted(missing_tfs))}")
         report_data["confidence"] = max(30, report_data["confidence"] - len(missing_tfs) * 10)
     
-    # Delete existing report for this date/symbol
-    db.query(DailyReport).filter(
-        DailyReport.date == target_date,
-        DailyReport.symbol == symbol
-    ).delete()
-    
-    # Create new report
-    report = DailyReport(
+    # Create the report, replacing any existing one for this date/symbol
+    stmt = insert(DailyReport).values(
         date=target_date,
         symbol=symbol,
         report_json=report_data,
         primary_snapshot_id=primary_snapshot.id if primary_snapshot else None,
+        created_at=datetime.utcnow(),
     )
-    db.add(report)
-    db.commit()
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["symbol", "date"],
+        set_={
+            "report_json": stmt.excluded.report_json,
+            "primary_snapshot_id": stmt.excluded.primary_snapshot_id,
+            "created_at": stmt.excluded.created_at,
+        },
+    ).returning(DailyReport)
+    report = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    if commit:
+        db.commit()
     
     # Export to JSON file
     export_report_to_file(report, target_date, symbol)
@@ -175,8 +229,8 @@ def export_report_to_file(report: DailyReport, target_date: date, symbol: str):
         **report.report_json,
     }
     
-    with open(file_path, "w") as f:
-        json.dump(export_data, f, indent=2)
+    # orjson encodes straight to UTF-8 bytes (same 2-space layout as json.dump)
+    file_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 def get_report_summary(report: DailyReport) -> dict:
@@ -4,37 +4,51 @@ import json
 import re
 from typing import Any, Dict
 
+import orjson
 
-def extract_json_from_response(text: str) -> str:
+# Fenced code block, optionally tagged as json
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+_DECODER = json.JSONDecoder()
+
+
+def _largest_code_block(text: str):
+    """Contents of the largest fenced code block (most likely the main JSON), or None."""
+    return max((m.group(1) for m in _CODE_BLOCK_RE.finditer(text)), key=len, default=None)
+
+
+def _decode_raw_json(text: str):
     """
-    Extract JSON from a response that might contain markdown code blocks
-    or other text around it.
+    Decode the JSON object starting at the first brace in `text`.
+    raw_decode finds the end of the object and parses it in one C pass.
+    Returns (obj, start, end).
     """
-    # Try to find JSON in code blocks first
-    code_block_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    matches = re.findall(code_block_pattern, text)
-    
-    if matches:
-        # Return the largest match (most likely to be the main JSON)
-        return max(matches, key=len)
-    
-    # Try to find raw JSON (starts with { and ends with })
-    # Look for the outermost braces
     start = text.find('{')
     if start == -1:
         raise ValueError("No JSON object found in response")
     
-    # Find matching closing brace
-    depth = 0
-    for i, char in enumerate(text[start:], start):
-        if char == '{':
-            depth += 1
-        elif char == '}':
-            depth -= 1
-            if depth == 0:
-                return text[start:i+1]
+    try:
+        obj, end = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError as e:
+        if e.pos >= len(text):
+            raise ValueError("No complete JSON object found in response")
+        raise ValueError(f"Invalid JSON: {e}")
+    return obj, start, end
+
+
+def extract_json_from_response(text: str) -> str:
+    """
+    Extract JSON from a response that might contain markdown code blocks
+    or other text around it.
+    """
+    # Try to find JSON in code blocks first
+    largest = _largest_code_block(text)
+    if largest is not None:
+        return largest
     
-    raise ValueError("No complete JSON object found in response")
+    # Otherwise the raw object starting at the first brace
+    _, start, end = _decode_raw_json(text)
+    return text[start:end]
 
 
 def validate_signal_structure(signal: Dict[str, Any], symbol: str) -> Dict[str, Any]:
@@ -88,15 +102,28 @@ def parse_cursor_response(response_text: str) -> Dict[str, Any]:
     Returns parsed data structure.
     Raises ValueError if parsing fails.
     """
-    # Extract JSON from response
-    json_str = extract_json_from_response(response_text)
-    
-    # Parse JSON
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON: {e}")
+    # Extract and parse JSON from response; raw JSON is decoded while
+    # it is located
+    json_str = _largest_code_block(response_text)
+    if json_str is None:
+        data = _decode_raw_json(response_text)[0]
+    else:
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+    
+    return normalize_response(data)
+
+
+def normalize_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate and normalize an already-decoded analysis response
+    (see parse_cursor_response for the text form).
     
+    Returns parsed data structure.
+    Raises ValueError if the structure is invalid.
+    """
     # Validate structure
     if "signals" not in data:
         raise ValueError("Response must contain 'signals' object")
@@ -130,12 +157,10 @@ def save_response_to_file(response_text: str, date_str: str) -> str:
     # Try to parse and pretty-print
     try:
         json_str = extract_json_from_response(response_text)
-        data = json.loads(json_str)
-        formatted = json.dumps(data, indent=2)
+        formatted = orjson.dumps(orjson.loads(json_str), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
     except Exception:
-        formatted = response_text
+        formatted = response_text.encode("utf-8")
     
-    with open(file_path, "w") as f:
-        f.write(formatted)
+    file_path.write_bytes(formatted)
     
     return str(file_path)
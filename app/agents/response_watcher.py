@@ -9,55 +9,82 @@ This serves as a fallback when ChatGPT automation fails.
 
 import json
 import os
+import threading
 import time
+import uuid
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Watch configuration
 WATCH_FILE = "latest.json"
-POLL_INTERVAL = 2  # seconds
+POLL_INTERVAL = 2  # seconds (fallback when watchdog isn't installed)
+PROGRESS_INTERVAL = 30  # seconds between "still waiting" messages
+
+# File-system events that can mean the response file has new content
+# (moved covers a temp file renamed into place; opened/closed-without-write
+# events, which the watcher's own reads produce, are ignored)
+_CHANGE_EVENTS = frozenset(("created", "modified", "moved", "closed"))
 
 
+@lru_cache(maxsize=1)
 def get_response_file_path() -> Path:
-    """Get the path to the watched response file."""
+    """Get the path to the watched response file (resolved once)."""
     from app.config import RESPONSES_DIR
     return RESPONSES_DIR / WATCH_FILE
 
 
-def check_for_new_response(last_modified: Optional[float] = None) -> Optional[dict]:
+@lru_cache(maxsize=1)
+def _known_symbols() -> frozenset:
+    """Configured symbols, upper-cased, for membership checks."""
+    from app.config import SYMBOLS
+    return frozenset(s.upper() for s in SYMBOLS)
+
+
+def check_for_new_response(
+    last_modified: Optional[float] = None,
+    last_size: Optional[int] = None
+) -> Optional[dict]:
     """
     Check if a new response file exists.
     
     Args:
         last_modified: Previous modification time to compare against
+        last_size: Previous file size; a same-mtime rewrite is only picked
+            up when the size differs
         
     Returns:
         Parsed JSON data if new file detected, None otherwise
     """
     response_file = get_response_file_path()
     
-    if not response_file.exists():
+    # A single stat answers both "does it exist" and "has it changed"
+    try:
+        st = os.stat(response_file)
+    except FileNotFoundError:
         return None
     
-    current_mtime = response_file.stat().st_mtime
-    
-    # Check if file is new or modified
-    if last_modified is not None and current_mtime <= last_modified:
-        return None
+    # Check if file is new or modified, without opening it
+    if last_modified is not None:
+        if st.st_mtime < last_modified:
+            return None
+        if st.st_mtime == last_modified and (last_size is None or st.st_size == last_size):
+            return None
     
     try:
-        with open(response_file, "r") as f:
-            content = f.read().strip()
+        content = response_file.read_bytes().strip()
         
         if not content:
             return None
         
-        # Try to parse JSON
-        data = json.loads(content)
+        # Try to parse JSON (orjson's decode error subclasses json's)
+        data = orjson.loads(content)
         logger.info(f"New response detected: {response_file}")
         return data
         
@@ -83,8 +110,15 @@ def save_response_for_processing(response_data: dict) -> str:
     response_file = get_response_file_path()
     response_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(response_file, "w") as f:
-        json.dump(response_data, f, indent=2)
+    # Write beside the target and rename over it, so the watcher never reads
+    # a half-written file
+    tmp_file = response_file.with_name(f".{response_file.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_file.write_bytes(orjson.dumps(response_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_file, response_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
     
     logger.info(f"Response saved to {response_file}")
     return str(response_file)
@@ -117,6 +151,29 @@ def archive_response(response_file: Path) -> Optional[str]:
         return None
 
 
+# Columns of an aggregate TA signal taken from a response
+_SIGNAL_COLUMNS = ("bias", "confidence", "levels_json", "ict_notes", "turtle_soup_json", "trade_plan_json")
+
+
+def _store_signal(db, target_date: date, symbol: str, **columns):
+    """
+    Insert the aggregate TA signal for a symbol/date, replacing any existing
+    one in the same statement. Signal columns not given are stored as NULL.
+    """
+    from sqlalchemy.dialects.sqlite import insert
+    from app.models import TASignal
+    
+    values = {name: columns.get(name) for name in _SIGNAL_COLUMNS}
+    values["created_at"] = datetime.utcnow()
+    
+    stmt = insert(TASignal).values(date=target_date, symbol=symbol, timeframe=None, **values)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["symbol", "date"],
+        index_where=TASignal.timeframe.is_(None),
+        set_=values,
+    ))
+
+
 def process_symbol_response(symbol: str, data: dict) -> bool:
     """
     Process analysis response for a single symbol.
@@ -130,7 +187,6 @@ def process_symbol_response(symbol: str, data: dict) -> bool:
     """
     from app.database import SessionLocal
     from app.agents.report_composer import compose_report
-    from app.models import TASignal
     
     logger.info(f"Processing {symbol} response...")
     
@@ -140,18 +196,9 @@ def process_symbol_response(symbol: str, data: dict) -> bool:
     try:
         symbol = symbol.upper()
         
-        # Delete existing signal for today
-        db.query(TASignal).filter(
-            TASignal.date == today,
-            TASignal.symbol == symbol,
-            TASignal.timeframe.is_(None)
-        ).delete()
-        
-        # Create new signal from response
-        ta_signal = TASignal(
-            date=today,
-            symbol=symbol,
-            timeframe=None,  # Aggregate signal
+        # Store the signal from the response, replacing today's
+        _store_signal(
+            db, today, symbol,
             bias=data.get("bias", "neutral"),
             confidence=data.get("confidence", 50),
             levels_json=data.get("levels"),
@@ -159,21 +206,18 @@ def process_symbol_response(symbol: str, data: dict) -> bool:
             turtle_soup_json=data.get("turtle_soup"),
             trade_plan_json=data.get("trade_plan"),
         )
-        db.add(ta_signal)
-        db.commit()
         
         logger.info(f"Stored signal for {symbol}: {data.get('bias')} ({data.get('confidence')}%)")
         
         # Generate report for this symbol
-        try:
-            report = compose_report(db, today, symbol)
-            if report:
-                logger.info(f"Generated report for {symbol}")
-            else:
-                logger.warning(f"Could not generate report for {symbol}")
-        except Exception as e:
-            logger.error(f"Error generating report for {symbol}: {e}")
+        report = compose_report(db, today, symbol, commit=False)
+        if report:
+            logger.info(f"Generated report for {symbol}")
+        else:
+            logger.warning(f"Could not generate report for {symbol}")
         
+        # Signal and report are committed together
+        db.commit()
         return True
         
     except Exception as e:
@@ -195,9 +239,8 @@ def process_response_data(data: dict) -> bool:
         True if processing succeeded
     """
     from app.database import SessionLocal
-    from app.agents.response_parser import parse_cursor_response
-    from app.agents.report_composer import compose_report
-    from app.models import TASignal
+    from app.agents.response_parser import normalize_response
+    from app.agents.report_composer import compose_reports_for_date
     from app.config import SYMBOLS
     
     logger.info("Processing response data...")
@@ -208,8 +251,9 @@ def process_response_data(data: dict) -> bool:
             symbol = data.get("symbol", "").upper()
             return process_symbol_response(symbol, data)
         
-        # Otherwise, parse as multi-symbol format (old)
-        parsed = parse_cursor_response(json.dumps(data))
+        # Otherwise, parse as multi-symbol format (old); already decoded,
+        # so only validation and normalization are needed
+        parsed = normalize_response(data)
         signals = parsed.get("signals", {})
         
         db = SessionLocal()
@@ -218,47 +262,34 @@ def process_response_data(data: dict) -> bool:
         try:
             # Store signals for each symbol
             for symbol, signal_data in signals.items():
-                if symbol.upper() not in [s.upper() for s in SYMBOLS]:
+                if symbol.upper() not in _known_symbols():
                     logger.warning(f"Skipping unknown symbol: {symbol}")
                     continue
                 
                 symbol = symbol.upper()
                 
-                # Delete existing signal for today
-                db.query(TASignal).filter(
-                    TASignal.date == today,
-                    TASignal.symbol == symbol,
-                    TASignal.timeframe.is_(None)
-                ).delete()
-                
-                # Create new signal
-                ta_signal = TASignal(
-                    date=today,
-                    symbol=symbol,
-                    timeframe=None,  # Aggregate signal
+                # Store the signal, replacing today's
+                _store_signal(
+                    db, today, symbol,
                     bias=signal_data.get("bias", "neutral"),
                     confidence=signal_data.get("confidence", 50),
                     levels_json=signal_data.get("levels"),
                     ict_notes=signal_data.get("ict_notes"),
                     turtle_soup_json=signal_data.get("turtle_soup"),
                 )
-                db.add(ta_signal)
                 
                 logger.info(f"Stored signal for {symbol}: {signal_data.get('bias')} ({signal_data.get('confidence')}%)")
             
-            db.commit()
-            
-            # Generate reports for each symbol
-            for symbol in SYMBOLS:
-                try:
-                    report = compose_report(db, today, symbol)
-                    if report:
-                        logger.info(f"Generated report for {symbol}")
-                    else:
-                        logger.warning(f"Could not generate report for {symbol}")
-                except Exception as e:
-                    logger.error(f"Error generating report for {symbol}: {e}")
+            # Generate reports for each symbol (shared calendar/news context)
+            reports = compose_reports_for_date(db, today, SYMBOLS, commit=False)
+            for symbol, report in reports.items():
+                if report:
+                    logger.info(f"Generated report for {symbol}")
+                else:
+                    logger.warning(f"Could not generate report for {symbol}")
             
+            # All signals and reports are committed in one transaction
+            db.commit()
             return True
             
         finally:
@@ -269,6 +300,89 @@ def process_response_data(data: dict) -> bool:
         return False
 
 
+def _poll_for_response_data(
+    initial_mtime: Optional[float],
+    initial_size: Optional[int],
+    timeout: int
+) -> Optional[dict]:
+    """Check the response file every POLL_INTERVAL seconds until timeout."""
+    start_time = time.time()
+    
+    while time.time() - start_time < timeout:
+        data = check_for_new_response(initial_mtime, initial_size)
+        if data:
+            return data
+        
+        # Show progress
+        elapsed = int(time.time() - start_time)
+        remaining = timeout - elapsed
+        if elapsed % PROGRESS_INTERVAL == 0 and elapsed > 0:
+            print(f"⏳ Still waiting... ({remaining}s remaining)")
+        
+        time.sleep(POLL_INTERVAL)
+    
+    return None
+
+
+def _wait_for_response_data(
+    response_file: Path,
+    initial_mtime: Optional[float],
+    initial_size: Optional[int],
+    timeout: int
+) -> Optional[dict]:
+    """
+    Block until a new response is available or the timeout passes.
+    
+    With watchdog installed, the response directory is watched through the
+    OS file-event API (inotify/FSEvents/ReadDirectoryChangesW) and the file
+    is only read when it changes; otherwise it is polled.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return _poll_for_response_data(initial_mtime, initial_size, timeout)
+    
+    found = {}
+    done = threading.Event()
+    
+    class _ResponseHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if done.is_set() or event.event_type not in _CHANGE_EVENTS:
+                return
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if response_file.name not in map(os.path.basename, paths):
+                return
+            data = check_for_new_response(initial_mtime, initial_size)
+            if data:
+                found["data"] = data
+                done.set()
+    
+    observer = Observer()
+    observer.schedule(_ResponseHandler(), str(response_file.parent), recursive=False)
+    observer.start()
+    
+    try:
+        # The file may have been written before the observer started
+        data = check_for_new_response(initial_mtime, initial_size)
+        if data:
+            return data
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if done.wait(min(PROGRESS_INTERVAL, remaining)):
+                return found["data"]
+            remaining = int(deadline - time.monotonic())
+            if remaining > 0:
+                print(f"⏳ Still waiting... ({remaining}s remaining)")
+    finally:
+        observer.stop()
+        observer.join()
+
+
 def watch_for_response(
     timeout: int = 300,
     callback: Optional[Callable[[dict], bool]] = None
@@ -287,12 +401,12 @@ def watch_for_response(
         callback = process_response_data
     
     response_file = get_response_file_path()
-    start_time = time.time()
     
-    # Get initial modification time if file exists
-    initial_mtime = None
+    # Get initial modification time and size if file exists
+    initial_mtime = initial_size = None
     if response_file.exists():
-        initial_mtime = response_file.stat().st_mtime
+        st = response_file.stat()
+        initial_mtime, initial_size = st.st_mtime, st.st_size
     
     logger.info(f"Watching for response file: {response_file}")
     logger.info(f"Timeout: {timeout} seconds")
@@ -302,31 +416,22 @@ def watch_for_response(
     print(f"   Timeout: {timeout // 60} minutes")
     print("="*60 + "\n")
     
-    while time.time() - start_time < timeout:
-        data = check_for_new_response(initial_mtime)
-        
-        if data:
-            print("\n✅ Response detected! Processing...")
-            
-            # Process the response
-            success = callback(data)
-            
-            if success:
-                # Archive the processed file
-                archive_response(response_file)
-                print("✅ Response processed successfully!")
-                return data
-            else:
-                print("❌ Failed to process response")
-                return None
+    data = _wait_for_response_data(response_file, initial_mtime, initial_size, timeout)
+    
+    if data:
+        print("\n✅ Response detected! Processing...")
         
-        # Show progress
-        elapsed = int(time.time() - start_time)
-        remaining = timeout - elapsed
-        if elapsed % 30 == 0 and elapsed > 0:
-            print(f"⏳ Still waiting... ({remaining}s remaining)")
+        # Process the response
+        success = callback(data)
         
-        time.sleep(POLL_INTERVAL)
+        if success:
+            # Archive the processed file
+            archive_response(response_file)
+            print("✅ Response processed successfully!")
+            return data
+        else:
+            print("❌ Failed to process response")
+            return None
     
     print("\n⏰ Timeout - no response received")
     logger.warning("Response watcher timeout")
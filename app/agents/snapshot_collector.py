@@ -3,8 +3,10 @@
 import re
 import shutil
 from datetime import datetime, date
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -132,3 +134,21 @@ def get_snapshots_for_date(db: Session, target_date: date, symbol: Optional[str]
         query = query.filter(Snapshot.symbol == symbol)
     
     return query.order_by(Snapshot.symbol, Snapshot.timeframe).all()
+
+
+def get_snapshots_indexed(db: Session, target_date: date, symbols: List[str]) -> Dict[str, Dict[str, Snapshot]]:
+    """
+    Get a date's snapshots for `symbols` as {symbol: {timeframe: snapshot}}.
+    Every requested symbol has an entry (empty if nothing was captured); the
+    latest capture of a timeframe wins.
+    """
+    rows = db.query(Snapshot).filter(
+        Snapshot.captured_at >= datetime.combine(target_date, datetime.min.time()),
+        Snapshot.captured_at < datetime.combine(target_date, datetime.max.time()),
+        Snapshot.symbol.in_(symbols),
+    ).order_by(Snapshot.symbol, Snapshot.timeframe, Snapshot.captured_at).all()
+    
+    indexed = {symbol: {} for symbol in symbols}
+    for symbol, group in groupby(rows, key=attrgetter("symbol")):
+        indexed[symbol] = {snap.timeframe: snap for snap in group}
+    return indexed
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from app.config import BASE_DIR, SCREENSHOTS_DIR
 from app.database import init_db
+from app.agents.news_collector import open_client, close_client
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -24,8 +25,15 @@ app.mount("/screenshots", StaticFiles(directory=SCREENSHOTS_DIR), name="screensh
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database and the shared HTTP client on startup."""
     init_db()
+    await open_client()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP client on shutdown."""
+    await close_client()
 
 
 # Import and include routers
@@ -1,7 +1,7 @@
 """SQLAlchemy ORM models for the advisor database."""
 
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Float, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Float, ForeignKey, JSON, Index, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -25,9 +25,15 @@ class Snapshot(Base):
 class EconomicEvent(Base):
     """ForexFactory calendar events."""
     __tablename__ = "economic_events"
+    __table_args__ = (
+        # Time first: calendar queries are range scans filtered by currency/impact
+        Index("ix_economic_events_time_ccy_impact", "event_time_utc", "currency", "impact"),
+        # Identity of a calendar event, used as the upsert conflict target
+        Index("ix_event_identity", "event_time_utc", "currency", "title", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    event_time_utc = Column(DateTime, nullable=False, index=True)
+    event_time_utc = Column(DateTime, nullable=False)
     currency = Column(String(5), nullable=False, index=True)  # USD, EUR, etc.
     impact = Column(String(10), nullable=False)  # high, medium, low
     title = Column(String(500), nullable=False)
@@ -45,10 +51,17 @@ class EconomicEvent(Base):
 class NewsItem(Base):
     """News articles related to Fed/FOMC."""
     __tablename__ = "news_items"
+    __table_args__ = (
+        # FOMC news is read by category over a date range
+        Index("ix_news_items_category_published", "category", "published_at"),
+        # Top drivers are read in confidence order within the recent window
+        Index("ix_news_items_confidence_published", "confidence", "published_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     published_at = Column(DateTime, nullable=False, index=True)
     source = Column(String(100), nullable=False)
+    category = Column(String(20), nullable=True)  # FOMC, Speech, Economic Data, Other
     title = Column(String(1000), nullable=False)
     url = Column(String(2000), nullable=False, unique=True)
     summary = Column(Text, nullable=True)  # Filled in after Cursor analysis
@@ -63,6 +76,11 @@ class NewsItem(Base):
 class TASignal(Base):
     """Technical analysis signals from Cursor analysis."""
     __tablename__ = "ta_signals"
+    __table_args__ = (
+        Index("ix_ta_signals_symbol_date", "symbol", "date"),
+        # One aggregate (timeframe NULL) signal per symbol/date, used as the upsert conflict target
+        Index("ix_ta_signals_aggregate", "symbol", "date", unique=True, sqlite_where=text("timeframe IS NULL")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(Date, nullable=False, index=True)
@@ -83,6 +101,10 @@ class TASignal(Base):
 class DailyReport(Base):
     """Generated daily trade plans."""
     __tablename__ = "daily_reports"
+    __table_args__ = (
+        # One report per symbol/date, used as the upsert conflict target
+        Index("ix_daily_reports_symbol_date", "symbol", "date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(Date, nullable=False, index=True)
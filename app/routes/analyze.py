@@ -11,7 +11,7 @@ from app.database import get_db
 from app.models import TASignal, DailyReport, Snapshot
 from app.config import BASE_DIR, PROMPTS_DIR, SYMBOLS
 from app.agents.response_parser import parse_cursor_response
-from app.agents.report_composer import compose_report
+from app.agents.report_composer import compose_reports_for_date
 
 router = APIRouter()
 templates = Jinja2Templates(directory=BASE_DIR / "app" / "templates")
@@ -44,7 +44,7 @@ async def analyze_page(request: Request, db: Session = Depends(get_db)):
     # Read prompt content if exists
     prompt_content = None
     if prompt_exists:
-        with open(prompt_path, "r") as f:
+        with open(prompt_path, "r", encoding="utf-8") as f:
             prompt_content = f.read()
     
     return templates.TemplateResponse("analyze.html", {
@@ -95,13 +95,13 @@ async def submit_analysis(
             )
             db.add(signal)
         
+        # Generate reports; signals and reports are committed together
+        # (flushed first so the composer's queries see the new signals)
+        db.flush()
+        signals = parsed.get("signals", {})
+        compose_reports_for_date(db, today, [s for s in SYMBOLS if s in signals], commit=False)
         db.commit()
         
-        # Generate reports
-        for symbol in SYMBOLS:
-            if symbol in parsed.get("signals", {}):
-                compose_report(db, today, symbol)
-        
         return RedirectResponse(
             url="/analyze?success=Analysis+saved+successfully",
             status_code=303
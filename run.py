@@ -400,7 +400,7 @@ def analyze_cmd(headless, auto_open, skip_screenshots, manual, symbol):
             click.echo(f"   ✓ Saved to: {prompt_path}")
             
             # Read prompt content
-            with open(prompt_path, "r") as f:
+            with open(prompt_path, "r", encoding="utf-8") as f:
                 prompt_text = f.read()
             
             # 3c: Get AI analysis for this symbol